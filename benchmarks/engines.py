@@ -0,0 +1,62 @@
+"""Пропускная способность движков опроса на имитации сетевых задержек.
+
+Запуск: python -m benchmarks.engines [получателей] [задержка, мс]
+"""
+import os
+import sys
+import time
+
+from engine import ENGINES, create_engine
+from homework import Homework, Tenant, TenantState, parse_status
+
+LATENCY = 0.005
+
+
+def bot_factory():
+    """Бот не нужен: отправка имитируется задержкой."""
+    return None
+
+
+def process(bot, tenant, state):
+    """Имитация опроса API и отправки: две задержки и разбор статуса."""
+    time.sleep(LATENCY)
+    state.homework = Homework(1, tenant.id, 'approved')
+    state.prev_message = parse_status(state.homework)
+    time.sleep(LATENCY)
+
+
+def measure(name, count, workers):
+    """Получателей в секунду для движка."""
+    jobs = [
+        (Tenant(str(i), 'token', i), TenantState(0)) for i in range(count)
+    ]
+    engine = create_engine(name, bot_factory, process, workers)
+    try:
+        engine.run(jobs[:workers])
+        start = time.perf_counter()
+        engine.run(jobs)
+        return count / (time.perf_counter() - start)
+    finally:
+        engine.close()
+
+
+def main(count=2000, latency_ms=5):
+    """Сравнение движков на одинаковой нагрузке."""
+    global LATENCY
+    LATENCY = latency_ms / 1000
+    cores = os.cpu_count() or 1
+    workers = {'sequential': 1, 'processes': cores}
+    for name in ENGINES:
+        if name == 'sequential':
+            jobs = max(count // 20, 1)
+        else:
+            jobs = count
+        rate = measure(name, jobs, workers.get(name, 32))
+        print(
+            f'{name:>10}: {rate:9.1f} получателей/с, '
+            f'{rate / cores:9.1f} на ядро'
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
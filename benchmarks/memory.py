@@ -0,0 +1,68 @@
+"""Память на одного получателя: словари ответа API против записей.
+
+Запуск: python -m benchmarks.memory [количество получателей]
+"""
+import json
+import sys
+import time
+import tracemalloc
+
+from homework import Homework, TenantState
+
+RESPONSE = json.dumps({
+    'homeworks': [{
+        'id': 123,
+        'status': 'approved',
+        'homework_name': 'student__homework_bot.zip',
+        'reviewer_comment': 'Всё нравится',
+        'date_updated': '2020-02-13T14:40:57Z',
+        'lesson_name': 'Итоговый проект'
+    }],
+    'current_date': 1581604970
+})
+
+
+def dict_states(count):
+    """Состояние как в исходном цикле: сырой словарь работы."""
+    return [
+        {
+            'timestamp': int(time.time()),
+            'prev_message': '',
+            'homework': json.loads(RESPONSE)['homeworks'][0],
+        }
+        for _ in range(count)
+    ]
+
+
+def record_states(count):
+    """Состояние на записях со __slots__, построенных при разборе."""
+    return [
+        TenantState(
+            int(time.time()),
+            homework=Homework.from_dict(json.loads(RESPONSE)['homeworks'][0])
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(factory, count):
+    """Объём памяти в байтах на одного получателя."""
+    tracemalloc.start()
+    states = factory(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del states
+    return size / count
+
+
+def main(count=50_000):
+    """Сравнение представлений состояния."""
+    for factory in (dict_states, record_states):
+        print(
+            f'{factory.__name__:>14}: '
+            f'{measure(factory, count):8.1f} байт/получатель'
+        )
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
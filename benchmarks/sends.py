@@ -0,0 +1,111 @@
+"""Пропускная способность отправки через локальный поддельный Bot API.
+
+Запуск: python -m benchmarks.sends [сообщений] [задержка сервера, мс]
+"""
+import json
+import sys
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from homework import send_tenant_message
+from telegram_client import create_client
+
+TOKEN = '1234:abcdefg'
+
+
+class FakeBotAPIHandler(BaseHTTPRequestHandler):
+    """Ответ на sendMessage с задержкой, как у удалённого сервера."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def setup(self):
+        """Подсчёт открытых клиентом соединений."""
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        """Ответ в формате Bot API с отправленным сообщением."""
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        time.sleep(self.latency)
+        with self.server.lock:
+            self.server.messages += 1
+            message_id = self.server.messages
+        body = json.dumps({'ok': True, 'result': {
+            'message_id': message_id,
+            'date': int(time.time()),
+            'chat': {'id': 1, 'type': 'private'},
+            'text': 'ok',
+        }}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Запросы не пишутся в stderr."""
+        pass
+
+
+def start_fake_bot_api(latency=0.0):
+    """Поддельный Bot API в фоновом потоке, возвращает сервер и base_url."""
+    handler = type('Handler', (FakeBotAPIHandler,), {'latency': latency})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.messages = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f'http://{host}:{port}/bot'
+
+
+def send_many(bot, messages, send, workers):
+    """Одновременная отправка через общий пул, как в движке threads.
+
+    send(bot, chat_id, text) вызывается для каждой пары (chat_id, text)
+    не более чем в workers потоках; результаты в порядке сообщений.
+    """
+    if workers <= 1 or len(messages) <= 1:
+        return [send(bot, chat_id, text) for chat_id, text in messages]
+    with ThreadPoolExecutor(min(workers, len(messages))) as executor:
+        return list(executor.map(
+            lambda message: send(bot, *message), messages
+        ))
+
+
+def measure(base_url, count, fan_out, pool_size):
+    """Сообщений в секунду при fan_out одновременных отправках."""
+    bot = create_client(TOKEN, pool_size=pool_size, base_url=base_url)
+    messages = [(1, f'сообщение {i}') for i in range(count)]
+    start = time.perf_counter()
+    results = send_many(bot, messages, send_tenant_message, fan_out)
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return count / elapsed
+
+
+def main(count=400, latency_ms=10):
+    """Сравнение отправки при разной одновременности."""
+    server, base_url = start_fake_bot_api(latency_ms / 1000)
+    try:
+        for fan_out in (1, 4, 16, 32):
+            server.connections = 0
+            rate = measure(base_url, count, fan_out, fan_out)
+            print(
+                f'одновременно {fan_out:>2}: '
+                f'{rate:8.1f} сообщений/с, '
+                f'соединений открыто {server.connections}'
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
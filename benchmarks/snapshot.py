@@ -0,0 +1,59 @@
+"""Запись и чтение снимка статусов на большом числе получателей.
+
+Запуск: python -m benchmarks.snapshot [получателей]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from homework import Homework
+from snapshot import SnapshotReader, SnapshotWriter
+
+
+def timed(label, count, action):
+    """Время действия на одну запись, мкс."""
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    print(f'{label:>24}: {elapsed * 1e6 / count:7.2f} мкс/запись')
+
+
+def main(count=200_000):
+    """Запись, обновление на месте, полное и точечное чтение, промахи."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'statuses.snap')
+        writer = SnapshotWriter(path)
+        tenants = [f'tenant-{i}' for i in range(count)]
+        reviewing = Homework(1, 'hw', 'reviewing', 1581604857)
+        approved = Homework(1, 'hw', 'approved', 1581608457)
+
+        timed('первичная запись', count, lambda: [
+            writer.update(tenant, reviewing) for tenant in tenants
+        ])
+        timed('обновление на месте', count, lambda: [
+            writer.update(tenant, approved) for tenant in tenants
+        ])
+        timed('без изменений', count, lambda: [
+            writer.update(tenant, approved) for tenant in tenants
+        ])
+
+        reader = SnapshotReader(path)
+        timed('полное чтение', count, lambda: list(reader.records()))
+        reader.get(tenants[0])
+        sample = random.sample(tenants, min(count, 10_000))
+        timed('чтение по получателю', len(sample), lambda: [
+            reader.get(tenant) for tenant in sample
+        ])
+        timed('промах', 10_000, lambda: [
+            reader.get('nobody') for _ in range(10_000)
+        ])
+        print(f'{"размер файла":>24}: {os.path.getsize(path) / count:7.1f} '
+              'байт/получатель')
+        reader.close()
+        writer.close()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""Время холодного старта: импорт модуля бота и один цикл --once.
+
+Цикл --once опрашивает заглушку API с новым статусом работы и
+отправляет сообщение в локальный поддельный Bot API.
+
+Запуск: python -m benchmarks.startup [количество запусков]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.sends import TOKEN, start_fake_bot_api
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ONCE = '\n'.join((
+    'import homework',
+    'homework.get_tenant_answer = lambda ts, headers: {',
+    "    'homeworks': [{'homework_name': 'hw', 'status': 'approved'}],",
+    "    'current_date': ts + 1,",
+    '}',
+    'homework.main(once=True)',
+))
+
+SCENARIOS = {
+    'интерпретатор': 'pass',
+    'import homework': 'import homework',
+    'жадный импорт': 'import dotenv, requests, telegram, homework',
+    'homework --once': ONCE,
+}
+
+
+def run(code, runs, env=None, state_file=None):
+    """Медиана времени запуска интерпретатора с кодом, мс.
+
+    Файл состояния удаляется перед каждым запуском, чтобы каждый
+    цикл --once находил новый статус и отправлял сообщение.
+    """
+    timings = []
+    for _ in range(runs):
+        if state_file and os.path.exists(state_file):
+            os.remove(state_file)
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-c', code], cwd=ROOT, check=True, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main(runs=20):
+    """Сравнение сценариев запуска."""
+    server, base_url = start_fake_bot_api()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            state_file = os.path.join(directory, 'state.json')
+            env = dict(
+                os.environ,
+                PRACTICUM_TOKEN='token',
+                TELEGRAM_TOKEN=TOKEN,
+                TELEGRAM_CHAT_ID='1',
+                TELEGRAM_API_URL=base_url,
+                STATE_FILE=state_file,
+            )
+            for name, code in SCENARIOS.items():
+                timing = run(code, runs, env, state_file)
+                print(f'{name:>16}: {timing:7.1f} мс')
+        assert server.messages >= runs, 'Цикл --once не отправил сообщения'
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,144 @@
+import os
+
+THREAD_WORKERS = 32
+ENGINE_ERROR = 'Неизвестный движок опроса {name}, доступны: {names}'
+
+_worker = None
+
+
+class SequentialEngine:
+    """Опрос получателей по очереди в одном потоке.
+
+    process(bot, tenant, state) изменяет состояние на месте;
+    run() возвращает состояния в порядке заданий.
+    """
+
+    def __init__(self, bot_factory, process, workers=None):
+        """Бот создаётся один раз на движок."""
+        self.bot = bot_factory()
+        self.process = process
+        self.workers = workers or 1
+
+    def handle(self, tenant, state):
+        """Обработка одного получателя."""
+        self.process(self.bot, tenant, state)
+        return state
+
+    def run(self, jobs):
+        """Один цикл опроса по списку пар (получатель, состояние)."""
+        return [self.handle(tenant, state) for tenant, state in jobs]
+
+    def close(self):
+        """Освобождение ресурсов движка."""
+        pass
+
+
+class ThreadEngine(SequentialEngine):
+    """Опрос в пуле потоков с общим ботом."""
+
+    def __init__(self, bot_factory, process, workers=None):
+        """По умолчанию THREAD_WORKERS потоков."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        super().__init__(bot_factory, process, workers or THREAD_WORKERS)
+        self.executor = ThreadPoolExecutor(self.workers)
+
+    def run(self, jobs):
+        """Один цикл опроса по списку пар (получатель, состояние)."""
+        return list(self.executor.map(lambda job: self.handle(*job), jobs))
+
+    def close(self):
+        """Освобождение ресурсов движка."""
+        self.executor.shutdown()
+
+
+class AsyncioEngine(ThreadEngine):
+    """Опрос из цикла событий asyncio с ограничением одновременности.
+
+    Запросы к API и Telegram синхронные, поэтому каждый получатель
+    обрабатывается в пуле потоков, а цикл событий ограничивает число
+    одновременных задач семафором.
+    """
+
+    def run(self, jobs):
+        """Один цикл опроса по списку пар (получатель, состояние)."""
+        import asyncio
+
+        return asyncio.run(self.gather(jobs))
+
+    async def gather(self, jobs):
+        """Запуск всех заданий с ограничением одновременности."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def handle(tenant, state):
+            async with semaphore:
+                return await loop.run_in_executor(
+                    self.executor, self.handle, tenant, state
+                )
+
+        return await asyncio.gather(
+            *(handle(tenant, state) for tenant, state in jobs)
+        )
+
+
+def _init_worker(bot_factory, process, concurrency):
+    """Движок asyncio внутри процесса пула."""
+    global _worker
+    _worker = AsyncioEngine(bot_factory, process, concurrency)
+
+
+def _run_chunk(jobs):
+    """Обработка части получателей в процессе пула."""
+    return _worker.run(jobs)
+
+
+class ProcessEngine:
+    """Пул процессов по числу ядер, в каждом свой цикл событий asyncio.
+
+    Состояния передаются в процессы и обратно, поэтому run()
+    возвращает новые объекты состояний, а не изменяет переданные.
+    """
+
+    def __init__(self, bot_factory, process, workers=None,
+                 concurrency=THREAD_WORKERS):
+        """Число процессов workers и одновременных задач в каждом."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            self.workers, initializer=_init_worker,
+            initargs=(bot_factory, process, concurrency)
+        )
+
+    def run(self, jobs):
+        """Один цикл опроса по списку пар (получатель, состояние)."""
+        jobs = list(jobs)
+        size = -(-len(jobs) // self.workers) or 1
+        chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        return [
+            state
+            for states in self.executor.map(_run_chunk, chunks)
+            for state in states
+        ]
+
+    def close(self):
+        """Освобождение ресурсов движка."""
+        self.executor.shutdown()
+
+
+ENGINES = {
+    'sequential': SequentialEngine,
+    'threads': ThreadEngine,
+    'asyncio': AsyncioEngine,
+    'processes': ProcessEngine,
+}
+
+
+def create_engine(name, bot_factory, process, workers=None):
+    """Движок опроса по имени из ENGINES."""
+    if name not in ENGINES:
+        raise ValueError(ENGINE_ERROR.format(name=name, names=list(ENGINES)))
+    return ENGINES[name](bot_factory, process, workers)
@@ -0,0 +1,85 @@
+import math
+import threading
+import time
+
+from collections import deque
+
+QUANTILES = (50, 90, 99)
+
+
+def percentile(values, quantile):
+    """Перцентиль по ближайшему рангу."""
+    ordered = sorted(values)
+    rank = math.ceil(quantile / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def summarize(values, quantiles=QUANTILES):
+    """Число замеров и перцентили задержки."""
+    if not values:
+        return {'count': 0}
+    summary = {'count': len(values), 'max': max(values)}
+    for quantile in quantiles:
+        summary[f'p{quantile}'] = percentile(values, quantile)
+    return summary
+
+
+class FreshnessTracker:
+    """Задержка от смены статуса работы до отправки уведомления.
+
+    Хранит последние замеры по каждому получателю и общие, вместе с
+    курсором опроса current_date. Замер больше threshold секунд
+    передаётся в on_alert(tenant_id, delay).
+    """
+
+    def __init__(self, threshold=None, on_alert=None, window=1000,
+                 tenant_window=32, clock=time.time):
+        """Хранится window общих замеров и tenant_window на получателя."""
+        self.threshold = threshold
+        self.on_alert = on_alert
+        self.tenant_window = tenant_window
+        self.clock = clock
+        self.delays = deque(maxlen=window)
+        self.tenants = {}
+        self.cursors = {}
+        self.lock = threading.Lock()
+
+    def record(self, tenant_id, delay, cursor=None):
+        """Замер задержки уведомления получателя."""
+        with self.lock:
+            self.delays.append(delay)
+            delays = self.tenants.get(tenant_id)
+            if delays is None:
+                delays = self.tenants[tenant_id] = deque(
+                    maxlen=self.tenant_window
+                )
+            delays.append(delay)
+            if cursor is not None:
+                self.cursors[tenant_id] = cursor
+        if (self.threshold is not None and delay > self.threshold
+                and self.on_alert is not None):
+            self.on_alert(tenant_id, delay)
+
+    def remove(self, tenant_id):
+        """Удаление замеров удалённого получателя."""
+        with self.lock:
+            self.tenants.pop(tenant_id, None)
+            self.cursors.pop(tenant_id, None)
+
+    def summary(self, tenant_id=None):
+        """Перцентили по получателю или по всем получателям."""
+        with self.lock:
+            if tenant_id is None:
+                summary = summarize(list(self.delays))
+                if self.threshold is not None:
+                    summary['tenants_over_threshold'] = sum(
+                        delays[-1] > self.threshold
+                        for delays in self.tenants.values()
+                    )
+                return summary
+            summary = summarize(list(self.tenants.get(tenant_id, ())))
+            cursor = self.cursors.get(tenant_id)
+        if cursor is not None:
+            summary['cursor'] = cursor
+            summary['cursor_age'] = self.clock() - cursor
+        return summary
@@ -1,14 +1,28 @@
+import argparse
+import calendar
+import functools
+import json
 import logging
 import os
-import requests
+import struct
 import sys
 import time
 
-from dotenv import load_dotenv
+from engine import THREAD_WORKERS, create_engine
+from freshness import FreshnessTracker
+from log_events import (
+    Event, JsonFormatter, SamplingFilter, TokenBucketFilter, parse_sampling
+)
 from logging import FileHandler, StreamHandler
-from telegram import Bot
+from snapshot import SnapshotWriter
+from telegram_client import create_client
+from tenants import Tenant, TenantConfigError, TenantRegistry
+from verdicts import VerdictCatalog, load_catalogs
 
-load_dotenv()
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+if os.path.exists(ENV_FILE):
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
 
 
 class NoSuccessfulResponse(Exception):
@@ -20,6 +34,8 @@ class NoSuccessfulResponse(Exception):
 PRACTICUM_TOKEN = os.getenv('PRACTICUM_TOKEN')
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
+TENANTS_FILE = os.getenv('TENANTS_FILE')
+DEFAULT_TENANT_ID = 'default'
 
 TOKENS_NAMES = [
     'PRACTICUM_TOKEN',
@@ -28,14 +44,42 @@ TOKENS_NAMES = [
 ]
 
 RETRY_TIME = 600
+STATE_FILE = os.getenv('STATE_FILE', __file__ + '.state.json')
+ENGINE = os.getenv('ENGINE', 'sequential')
+ENGINE_WORKERS = int(os.getenv('ENGINE_WORKERS', 0)) or None
+API_TIMEOUT = float(os.getenv('API_TIMEOUT', 30))
+TELEGRAM_API_URL = os.getenv('TELEGRAM_API_URL')
+TELEGRAM_POOL_SIZE = int(os.getenv('TELEGRAM_POOL_SIZE', THREAD_WORKERS))
+TELEGRAM_CONNECT_TIMEOUT = float(os.getenv('TELEGRAM_CONNECT_TIMEOUT', 5))
+TELEGRAM_READ_TIMEOUT = float(os.getenv('TELEGRAM_READ_TIMEOUT', 10))
+WATCHDOG_DEADLINE = float(os.getenv('WATCHDOG_DEADLINE', 300))
+STALL_ACTION = os.getenv('STALL_ACTION', 'dump')
+HEALTH_PORT = int(os.getenv('HEALTH_PORT', 0))
+POLL_HEARTBEAT = 'poll'
+SNAPSHOT_FILE = os.getenv('SNAPSHOT_FILE')
+FRESHNESS_THRESHOLD = float(os.getenv('FRESHNESS_THRESHOLD', 2 * RETRY_TIME))
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REDACTED_HEADERS = {'Authorization': 'OAuth ***'}
+
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')
+LOG_SAMPLING = os.getenv('LOG_SAMPLING', '')
+LOG_ERROR_RATE = float(os.getenv('LOG_ERROR_RATE', 1 / 60))
+LOG_ERROR_BURST = int(os.getenv('LOG_ERROR_BURST', 5))
+LOG_KEY_FIELDS = {'freshness_alert': ('tenant',)}
 
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+HOMEWORK_VERDICT_FALLBACK = os.getenv('HOMEWORK_VERDICT_FALLBACK')
+DEFAULT_LOCALE = os.getenv('DEFAULT_LOCALE', 'ru')
+LOCALES_DIR = os.getenv(
+    'LOCALES_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+)
+RENDER_CACHE_SIZE = 4096
 
 API_NOT_AVAILABLE = (
     'При запросе к ресурсу {url} c параметрами {headers} и {params}'
@@ -55,11 +99,30 @@ RESPONSE_NOT_DICT = 'Ответ не в ожидаемом формате {type}
 KEY_NOT_IN_RESPONSE = 'В ответе отсутствует ключ {key}'
 HOMEWORKS_ERROR = 'Список работ не в формате {type}'
 VERDICT_ERROR = 'Получен неизвестный статус работы {status}'
+LOCALE_ERROR = 'Нет каталога вердиктов для локали по умолчанию {locale}'
+HOMEWORK_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 TOKEN_ERROR = 'Отсутствуют переменные окружения: {name}'
 HOMEWORK_STATUS_CHANGE = 'Изменился статус проверки работы "{name}". {verdict}'
 MESSAGE_ERROR = 'Сбой в работе программы: {error}'
 MESSAGE_ERROR_SENT = 'Сообщение об ошибке "{message}" успешно отправлено'
 MESSAGE_SENT = 'Сообщение "{message}" успешно отправлено'
+WATCHDOG_ERROR = 'Сбой проверки зависаний: {error}'
+WATCHDOG_STALL = (
+    'Работа "{name}" не завершилась за {age:.0f} с, стеки потоков:\n{stacks}'
+)
+SNAPSHOT_ERROR = 'Не удалось обновить снимок статусов {tenant}: {error}'
+FRESHNESS_ALERT = (
+    'Уведомление получателю {tenant} отправлено через {delay:.0f} с'
+    ' после смены статуса, порог {threshold:.0f} с'
+)
+FRESHNESS_SUMMARY = (
+    'Задержка уведомлений: p50 {p50:.0f} с, p90 {p90:.0f} с,'
+    ' p99 {p99:.0f} с по {count} последним'
+)
+TENANTS_RELOADED = (
+    'Список получателей обновлён: добавлено {added},'
+    ' удалено {removed}, изменено {changed}'
+)
 TELEGRAM_ERROR = (
     'При отправке сообщения "{message}"'
     ' возникла ошибка "{error}".'
@@ -67,46 +130,123 @@ TELEGRAM_ERROR = (
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-stream_handler = StreamHandler(sys.stdout)
-file_handler = FileHandler(__file__ + '.log')
 
-formatter = logging.Formatter(
-    '%(asctime)s - %(levelname)s - %(message)s'
-)
-stream_handler.setFormatter(formatter)
-file_handler.setFormatter(formatter)
-logger.addHandler(stream_handler)
-logger.addHandler(file_handler)
+
+def configure_logging():
+    """Подключение обработчиков логов при запуске бота."""
+    stream_handler = StreamHandler(sys.stdout)
+    file_handler = FileHandler(__file__ + '.log')
+
+    if LOG_FORMAT == 'json':
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s'
+        )
+    logger.addFilter(SamplingFilter(parse_sampling(LOG_SAMPLING)))
+    logger.addFilter(TokenBucketFilter(
+        LOG_ERROR_RATE, LOG_ERROR_BURST, key_fields=LOG_KEY_FIELDS
+    ))
+    stream_handler.setFormatter(formatter)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
+    logger.addHandler(file_handler)
+
+
+class Homework:
+    """Запись о домашней работе из ответа API."""
+
+    __slots__ = ('id', 'name', 'status', 'date_updated')
+
+    def __init__(self, id, name, status, date_updated=None):
+        """Дата обновления хранится в секундах эпохи."""
+        self.id = id
+        self.name = name
+        self.status = status
+        self.date_updated = date_updated
+
+    @classmethod
+    def from_dict(cls, homework):
+        """Построение записи из словаря ответа API."""
+        status = homework['status']
+        return cls(
+            homework.get('id'),
+            homework['homework_name'],
+            sys.intern(status) if isinstance(status, str) else status,
+            parse_date(homework.get('date_updated')),
+        )
+
+
+class TenantState:
+    """Состояние опроса API для одного получателя."""
+
+    __slots__ = ('timestamp', 'prev_message', 'homework', 'delay', 'polled')
+
+    def __init__(self, timestamp, prev_message='', homework=None):
+        """Курсор опроса, последнее сообщение и последняя работа.
+
+        delay - задержка последнего уведомления, ещё не учтённая
+        в FreshnessTracker.
+        """
+        self.timestamp = timestamp
+        self.prev_message = prev_message
+        self.homework = homework
+        self.delay = None
+        self.polled = False
+
+
+def parse_date(value):
+    """Перевод даты из ответа API в секунды эпохи."""
+    if not value:
+        return None
+    try:
+        return calendar.timegm(time.strptime(value, HOMEWORK_DATE_FORMAT))
+    except (TypeError, ValueError):
+        return None
 
 
 def send_message(bot, message):
     """Отправка сообщения ботом."""
+    return send_tenant_message(bot, TELEGRAM_CHAT_ID, message)
+
+
+def send_tenant_message(bot, chat_id, message):
+    """Отправка сообщения ботом в чат получателя."""
     try:
         bot.send_message(
-            chat_id=TELEGRAM_CHAT_ID,
+            chat_id=chat_id,
             text=message
         )
-        logger.info(MESSAGE_SENT.format(message=message))
+        logger.info(Event('message_sent', MESSAGE_SENT, message=message))
         return True
     except Exception as error:
-        logger.exception(
-            TELEGRAM_ERROR.format(message=message, error=error)
-        )
+        logger.exception(Event(
+            'telegram_error', TELEGRAM_ERROR, message=message, error=error
+        ))
         return False
 
 
 def get_api_answer(timestamp):
     """Обработка ответа от API."""
+    return get_tenant_answer(timestamp, HEADERS)
+
+
+def get_tenant_answer(timestamp, headers):
+    """Обработка ответа от API с заголовками получателя."""
+    import requests
+
     params = {'from_date': timestamp}
-    api = dict(url=ENDPOINT, headers=HEADERS, params=params)
+    api = dict(url=ENDPOINT, headers=headers, params=params)
+    details = dict(api, headers=REDACTED_HEADERS)
+    api['timeout'] = API_TIMEOUT
     try:
         response = requests.get(**api)
     except requests.RequestException as error:
-        raise ConnectionError(API_NOT_AVAILABLE.format(code=error, **api))
+        raise ConnectionError(API_NOT_AVAILABLE.format(code=error, **details))
 
     if response.status_code != 200:
         raise NoSuccessfulResponse(
-            CONNECTION_ERROR.format(code=response.status_code, **api)
+            CONNECTION_ERROR.format(code=response.status_code, **details)
         )
     response_json = response.json()
 
@@ -114,7 +254,7 @@ def get_api_answer(timestamp):
         if key in response_json:
             raise requests.exceptions.InvalidJSONError(
                 API_REJECTION_MESSAGE.format(
-                    key=key, error=response_json.get(key), **api)
+                    key=key, error=response_json.get(key), **details)
             )
 
     return response_json
@@ -132,57 +272,358 @@ def check_response(response):
     return homeworks
 
 
+@functools.lru_cache(maxsize=None)
+def get_catalogs():
+    """Каталоги вердиктов по локалям, загружаются один раз на процесс."""
+    catalogs = load_catalogs(LOCALES_DIR, {'ru': VerdictCatalog(
+        HOMEWORK_STATUS_CHANGE, HOMEWORK_VERDICTS, HOMEWORK_VERDICT_FALLBACK
+    )})
+    if DEFAULT_LOCALE not in catalogs:
+        raise ValueError(LOCALE_ERROR.format(locale=DEFAULT_LOCALE))
+    return catalogs
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_status(name, status, locale):
+    """Сообщение о статусе, одинаковые сообщения берутся из кэша."""
+    catalogs = get_catalogs()
+    catalog = catalogs.get(locale) or catalogs[DEFAULT_LOCALE]
+    return catalog.render(name, status)
+
+
 def parse_status(homework):
     """Обработка ответа и получение информации."""
-    name = homework['homework_name']
-    status = homework['status']
-    if status not in HOMEWORK_VERDICTS:
-        raise ValueError(VERDICT_ERROR.format(status=status))
-    return HOMEWORK_STATUS_CHANGE.format(
-        name=name, verdict=HOMEWORK_VERDICTS[status]
-    )
+    return parse_tenant_status(homework, DEFAULT_LOCALE)
+
+
+def parse_tenant_status(homework, locale):
+    """Сообщение о статусе работы на языке получателя."""
+    if isinstance(homework, dict):
+        homework = Homework.from_dict(homework)
+    message = render_status(homework.name, homework.status, locale)
+    if message is None:
+        raise ValueError(VERDICT_ERROR.format(status=homework.status))
+    return message
 
 
 def check_tokens():
     """Проверка токенов."""
-    missing_tokens = [name for name in TOKENS_NAMES if not globals()[name]]
+    names = ['TELEGRAM_TOKEN'] if TENANTS_FILE else TOKENS_NAMES
+    missing_tokens = [name for name in names if not globals()[name]]
     if missing_tokens:
-        logger.critical(TOKEN_ERROR.format(name=missing_tokens))
+        logger.critical(
+            Event('tokens_missing', TOKEN_ERROR, name=missing_tokens)
+        )
         return False
 
     return True
 
 
-def main():
-    """Основная логика работы бота."""
-    if not check_tokens():
-        return None
+def load_states(path):
+    """Чтение сохранённых состояний опроса получателей."""
+    try:
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return {}
+    return {
+        tenant_id: TenantState(item['timestamp'], item.get('prev_message', ''))
+        for tenant_id, item in data.items()
+    }
+
+
+def save_states(path, states):
+    """Атомарная запись состояний опроса получателей."""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(
+            {
+                tenant_id: {
+                    'timestamp': state.timestamp,
+                    'prev_message': state.prev_message
+                }
+                for tenant_id, state in states.items()
+            },
+            file, ensure_ascii=False
+        )
+    os.replace(temp_path, path)
+
+
+def check_updates(bot, tenant, state):
+    """Один цикл опроса API, сравнения и отправки сообщения.
+
+    state.polled отмечает, что API вернул корректный ответ.
+    """
+    state.polled = False
+    try:
+        response = get_tenant_answer(state.timestamp, tenant.headers)
+        homeworks = check_response(response)
+        state.polled = True
+        if homeworks:
+            state.homework = Homework.from_dict(homeworks[0])
+            message = parse_tenant_status(state.homework, tenant.locale)
+            if (message != state.prev_message
+                    and send_tenant_message(bot, tenant.chat_id, message)):
+                state.prev_message = message
+                state.timestamp = response.get(
+                    'current_date', state.timestamp
+                )
+                if state.homework.date_updated is not None:
+                    state.delay = time.time() - state.homework.date_updated
+
+    except Exception as error:
+        message = MESSAGE_ERROR.format(error=error)
+        logger.error(Event(
+            'poll_error', MESSAGE_ERROR, error=error, tenant=tenant.id
+        ))
+        if (message != state.prev_message
+                and send_tenant_message(bot, tenant.chat_id, message)):
+            state.prev_message = message
+
+
+def create_registry():
+    """Реестр получателей из файла или из переменных окружения."""
+    if TENANTS_FILE:
+        registry = TenantRegistry(TENANTS_FILE)
+        registry.install_signal_handler()
+        return registry
+    return TenantRegistry(tenants=[
+        Tenant(DEFAULT_TENANT_ID, PRACTICUM_TOKEN, TELEGRAM_CHAT_ID)
+    ])
+
+
+def refresh_tenants(registry, states, *stores):
+    """Применение изменений списка получателей к состояниям опроса.
+
+    Удалённые получатели удаляются и из stores (снимок, замеры).
+    Возвращает False, если файл получателей прочитать не удалось.
+    """
+    try:
+        diff = registry.reload()
+    except TenantConfigError as error:
+        logger.error(Event('tenants_invalid', '{error}', error=error))
+        return False
+    for tenant_id in diff.removed:
+        states.pop(tenant_id, None)
+        for store in stores:
+            store.remove(tenant_id)
+    timestamp = int(time.time())
+    for tenant in diff.added:
+        states.setdefault(tenant.id, TenantState(timestamp))
+    if diff.added or diff.removed or diff.changed:
+        logger.info(Event(
+            'tenants_reloaded', TENANTS_RELOADED,
+            added=len(diff.added),
+            removed=len(diff.removed),
+            changed=len(diff.changed)
+        ))
+    return True
+
+
+def create_bot():
+    """Бот Telegram с пулом соединений, общий для всех получателей.
+
+    Создаётся по одному на движок или на процесс пула.
+    """
+    return create_client(
+        TELEGRAM_TOKEN,
+        pool_size=TELEGRAM_POOL_SIZE,
+        connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+        read_timeout=TELEGRAM_READ_TIMEOUT,
+        base_url=TELEGRAM_API_URL,
+    )
+
+
+def poll_tenants(engine, registry, states):
+    """Один цикл опроса всех получателей движком.
+
+    Возвращает число получателей, для которых API ответил.
+    """
+    jobs = [
+        (tenant, states[tenant_id])
+        for tenant_id, tenant in registry.tenants.items()
+    ]
+    polled = 0
+    for (tenant, _), state in zip(jobs, engine.run(jobs)):
+        states[tenant.id] = state
+        polled += state.polled
+    return polled
+
+
+def wait_for_poll(registry, states, *stores):
+    """Пауза RETRY_TIME до следующего цикла опроса.
+
+    Перезагрузка получателей по сигналу применяется сразу,
+    не дожидаясь конца паузы.
+    """
+    deadline = time.monotonic() + RETRY_TIME
+    while registry.wait(deadline - time.monotonic()):
+        refresh_tenants(registry, states, *stores)
+
+
+def run_poll(engine, registry, states, watchdog):
+    """Цикл опроса под наблюдением watchdog.
+
+    Успешным для /readyz считается цикл, в котором API ответил
+    хотя бы одному получателю.
+    """
+    watchdog.beat(POLL_HEARTBEAT)
+    polled = poll_tenants(engine, registry, states)
+    watchdog.finish(POLL_HEARTBEAT, ok=polled > 0)
+    return polled
+
+
+def handle_stall(name, age, stacks):
+    """Запись стеков зависшего цикла и выход при STALL_ACTION=exit."""
+    logger.critical(Event(
+        'watchdog_stall', WATCHDOG_STALL, name=name, age=age, stacks=stacks
+    ))
+    if STALL_ACTION == 'exit':
+        logging.shutdown()
+        os._exit(1)
+
+
+def handle_watchdog_error(error):
+    """Запись ошибки фоновой проверки зависаний."""
+    logger.error(
+        Event('watchdog_error', WATCHDOG_ERROR, error=error), exc_info=True
+    )
 
-    bot = Bot(token=TELEGRAM_TOKEN)
-    current_timestamp = int(time.time())
-    message = ''
-    prev_message = ''
 
-    while True:
+def create_watchdog(tracker):
+    """Watchdog цикла опроса и, если задан HEALTH_PORT, сервер проверок."""
+    from liveness import Watchdog, serve_health
+
+    watchdog = Watchdog(
+        WATCHDOG_DEADLINE, on_stall=handle_stall,
+        on_error=handle_watchdog_error
+    )
+    if HEALTH_PORT:
+        serve_health(
+            watchdog, HEALTH_PORT, ready_age=RETRY_TIME + WATCHDOG_DEADLINE,
+            routes={'/freshness': lambda query: tracker.summary(
+                query.get('tenant')
+            )}
+        )
+    watchdog.start()
+    return watchdog
+
+
+def alert_freshness(tenant_id, delay):
+    """Предупреждение о превышении порога задержки уведомления."""
+    logger.warning(Event(
+        'freshness_alert', FRESHNESS_ALERT,
+        tenant=tenant_id, delay=delay, threshold=FRESHNESS_THRESHOLD
+    ))
+
+
+def record_freshness(tracker, states):
+    """Учёт задержек уведомлений, отправленных за цикл опроса."""
+    recorded = 0
+    for tenant_id, state in states.items():
+        if state.delay is not None:
+            tracker.record(tenant_id, state.delay, state.timestamp)
+            state.delay = None
+            recorded += 1
+    if recorded:
+        logger.info(Event('freshness', FRESHNESS_SUMMARY, **tracker.summary()))
+
+
+def update_snapshot(snapshot, states):
+    """Запись последних статусов получателей в снимок."""
+    for tenant_id, state in states.items():
+        if state.homework is None:
+            continue
         try:
-            response = get_api_answer(current_timestamp)
-            homeworks = check_response(response)
-            if homeworks:
-                message = parse_status(homeworks[0])
-                if message != prev_message and send_message(bot, message):
-                    prev_message = message
-                    current_timestamp = response.get(
-                        'current_date', current_timestamp
-                    )
+            snapshot.update(tenant_id, state.homework)
+        except (ValueError, TypeError, OverflowError, struct.error) as error:
+            logger.error(Event(
+                'snapshot_error', SNAPSHOT_ERROR, tenant=tenant_id, error=error
+            ))
+
+
+def close_all(*resources):
+    """Закрытие созданных ресурсов, None пропускаются."""
+    for resource in resources:
+        if resource is not None:
+            resource.close()
+
+
+def prune_snapshot(snapshot, registry):
+    """Освобождение записей снимка получателей, которых нет в реестре.
+
+    Реестр каждого запуска начинается пустым, поэтому удалённые между
+    запусками получатели не попадают в diff.removed.
+    """
+    for tenant_id in set(snapshot.slots) - set(registry.tenants):
+        snapshot.remove(tenant_id)
+    return True
+
+
+def create_runtime(tracker):
+    """Снимок, движок и watchdog или None при ошибке настройки."""
+    snapshot = engine = None
+    try:
+        get_catalogs()
+        snapshot = SnapshotWriter(SNAPSHOT_FILE) if SNAPSHOT_FILE else None
+        engine = create_engine(
+            ENGINE, create_bot, check_updates, ENGINE_WORKERS
+        )
+        return snapshot, engine, create_watchdog(tracker)
+    except (ValueError, OSError) as error:
+        logger.critical(Event('config_invalid', '{error}', error=error))
+        close_all(engine, snapshot)
+        return None
 
-        except Exception as error:
-            message = MESSAGE_ERROR.format(error=error)
-            logger.error(message)
-            if message != prev_message and send_message(bot, message):
-                prev_message = message
 
-        time.sleep(RETRY_TIME)
+def main(once=False):
+    """Основная логика работы бота."""
+    if not check_tokens():
+        return None
+
+    tracker = FreshnessTracker(FRESHNESS_THRESHOLD, on_alert=alert_freshness)
+    runtime = create_runtime(tracker)
+    if runtime is None:
+        return None
+    snapshot, engine, watchdog = runtime
+    registry = create_registry()
+    states = load_states(STATE_FILE) if once else {}
+    stores = [store for store in (snapshot, tracker) if store is not None]
+    pruned = snapshot is None
+
+    try:
+        while True:
+            if not refresh_tenants(registry, states, *stores):
+                if once:
+                    return None
+            elif not pruned:
+                pruned = prune_snapshot(snapshot, registry)
+            run_poll(engine, registry, states, watchdog)
+            record_freshness(tracker, states)
+            if snapshot is not None:
+                update_snapshot(snapshot, states)
+            if once:
+                save_states(STATE_FILE, {
+                    tenant_id: states[tenant_id]
+                    for tenant_id in registry.tenants
+                })
+                return None
+            wait_for_poll(registry, states, *stores)
+    finally:
+        watchdog.stop()
+        close_all(engine, snapshot)
+
+
+def parse_args(args=None):
+    """Разбор аргументов командной строки."""
+    parser = argparse.ArgumentParser(description='Бот статусов домашних работ')
+    parser.add_argument(
+        '--once', action='store_true',
+        help='выполнить один цикл опроса с сохранённым состоянием и выйти'
+    )
+    return parser.parse_args(args)
 
 
 if __name__ == '__main__':
-    main()
+    configure_logging()
+    main(once=parse_args().once)
@@ -0,0 +1,166 @@
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from urllib.parse import parse_qsl, urlsplit
+
+WATCHDOG_ERROR = 'Сбой проверки зависаний'
+
+logger = logging.getLogger(__name__)
+
+
+def dump_stacks():
+    """Текущие стеки всех потоков процесса."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    return '\n'.join(
+        f'Поток {names.get(ident, ident)}:\n'
+        + ''.join(traceback.format_stack(frame))
+        for ident, frame in sys._current_frames().items()
+    )
+
+
+class Watchdog:
+    """Отметки о работе циклов опроса и поиск зависших.
+
+    beat(name) отмечает начало работы, success(name) - её успешное
+    завершение, finish(name) - завершение без результата. Работа,
+    не завершённая за deadline секунд, считается зависшей:
+    on_stall(name, age, stacks) вызывается один раз на зависание.
+    Ошибка фоновой проверки передаётся в on_error(error), без него
+    пишется в лог модуля.
+    """
+
+    def __init__(self, deadline, on_stall=None, interval=None,
+                 clock=time.monotonic, on_error=None):
+        """Проверка выполняется в фоне каждые interval секунд."""
+        self.deadline = deadline
+        self.on_stall = on_stall
+        self.on_error = on_error
+        self.interval = interval or min(deadline / 4, 5)
+        self.clock = clock
+        self.heartbeats = {}
+        self.stalled = set()
+        self.last_success = None
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def beat(self, name):
+        """Отметка о том, что работа name идёт."""
+        self.heartbeats[name] = self.clock()
+
+    def success(self, name):
+        """Успешное завершение работы name."""
+        self.finish(name, ok=True)
+
+    def finish(self, name, ok=False):
+        """Завершение работы name; last_success обновляется только при ok."""
+        if ok:
+            self.last_success = self.clock()
+        self.heartbeats.pop(name, None)
+        self.stalled.discard(name)
+
+    def last_poll_age(self):
+        """Секунды с последнего успешного опроса или None."""
+        if self.last_success is None:
+            return None
+        return self.clock() - self.last_success
+
+    def check(self):
+        """Поиск зависших работ, возвращает новые зависания."""
+        now = self.clock()
+        stalled = [
+            (name, now - beat) for name, beat in list(self.heartbeats.items())
+            if now - beat > self.deadline and name not in self.stalled
+        ]
+        for name, age in stalled:
+            self.stalled.add(name)
+            if self.on_stall is not None:
+                self.on_stall(name, age, dump_stacks())
+        return [name for name, _ in stalled]
+
+    def status(self):
+        """Состояние для проверок живости и готовности."""
+        return {
+            'stalled': sorted(self.stalled),
+            'last_poll_age': self.last_poll_age(),
+        }
+
+    def run(self):
+        """Фоновая проверка до вызова stop()."""
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as error:
+                if self.on_error is None:
+                    logger.exception(WATCHDOG_ERROR)
+                else:
+                    self.on_error(error)
+
+    def start(self):
+        """Запуск фоновой проверки."""
+        self.thread = threading.Thread(
+            target=self.run, name='watchdog', daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """Остановка фоновой проверки."""
+        self.stop_event.set()
+
+
+class HealthHandler:
+    """Ответы /healthz и /readyz по состоянию Watchdog.
+
+    Дополнительные пути из routes отвечают JSON, который возвращает
+    функция от параметров запроса. Примесь к BaseHTTPRequestHandler:
+    http.server импортируется только при запуске сервера проверок.
+    """
+
+    watchdog = None
+    ready_age = None
+    routes = {}
+
+    def do_GET(self):
+        """Живость: нет зависаний; готовность: был недавний опрос."""
+        url = urlsplit(self.path)
+        status = self.watchdog.status()
+        if url.path in self.routes:
+            healthy = True
+            status = self.routes[url.path](dict(parse_qsl(url.query)))
+        elif url.path == '/healthz':
+            healthy = not status['stalled']
+        elif url.path == '/readyz':
+            age = status['last_poll_age']
+            healthy = age is not None and age <= self.ready_age
+        else:
+            self.send_error(404)
+            return
+        body = json.dumps(dict(status, ok=healthy)).encode()
+        self.send_response(200 if healthy else 503)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Запросы проверок не пишутся в лог."""
+        pass
+
+
+def serve_health(watchdog, port, ready_age, host='', routes=None):
+    """HTTP-сервер проверок в фоновом потоке."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    handler = type(
+        'Handler', (HealthHandler, BaseHTTPRequestHandler),
+        {'watchdog': watchdog, 'ready_age': ready_age, 'routes': routes or {}}
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(
+        target=server.serve_forever, name='health', daemon=True
+    ).start()
+    return server
@@ -0,0 +1,155 @@
+import json
+import logging
+import threading
+import time
+
+SAMPLING_ERROR = 'Некорректная настройка сэмплирования логов: {item}'
+
+
+class Event:
+    """Событие лога с отложенным форматированием текста.
+
+    Шаблон форматируется только при выводе записи, а поля
+    сериализуются JsonFormatter без промежуточной строки.
+    """
+
+    __slots__ = ('name', 'template', 'fields')
+
+    def __init__(self, name, template, /, **fields):
+        """Имя события служит ключом сэмплирования и ограничения."""
+        self.name = name
+        self.template = template
+        self.fields = fields
+
+    def __str__(self):
+        """Текст события для обычного форматтера."""
+        return self.template.format(**self.fields)
+
+    @property
+    def key(self):
+        """Ключ повторяющегося события: имя и тип ошибки."""
+        error = self.fields.get('error')
+        if error is None:
+            return (self.name,)
+        return self.name, type(error).__name__
+
+
+def event_key(record, key_fields=None):
+    """Ключ записи лога для сэмплирования и ограничения.
+
+    key_fields - имена полей, добавляемых к ключу события по его имени.
+    """
+    if isinstance(record.msg, Event):
+        fields = (key_fields or {}).get(record.msg.name, ())
+        return record.msg.key + tuple(
+            record.msg.fields.get(field) for field in fields
+        )
+    if isinstance(record.msg, str):
+        return (record.msg,)
+    return (type(record.msg).__name__,)
+
+
+def serialize(value):
+    """Сериализация полей, которые json не умеет сам."""
+    if isinstance(value, BaseException):
+        return f'{type(value).__name__}: {value}'
+    return str(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """Одна JSON-строка на запись лога."""
+
+    def format(self, record):
+        """Поля события выводятся как есть, без текста шаблона."""
+        payload = {
+            'time': record.created,
+            'level': record.levelname,
+            'logger': record.name,
+        }
+        if isinstance(record.msg, Event):
+            payload['event'] = record.msg.name
+            payload['fields'] = record.msg.fields
+        else:
+            payload['message'] = record.getMessage()
+        for attr in ('sample_rate', 'suppressed'):
+            if getattr(record, attr, None):
+                payload[attr] = getattr(record, attr)
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=serialize)
+
+
+def parse_sampling(value):
+    """Разбор настройки вида "message_sent=10,poll_error=2"."""
+    rates = {}
+    for item in filter(None, (value or '').split(',')):
+        name, _, every = item.partition('=')
+        try:
+            rates[name.strip()] = int(every)
+        except ValueError:
+            raise ValueError(SAMPLING_ERROR.format(item=item))
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Пропуск каждой N-й записи события с настроенной частотой."""
+
+    def __init__(self, rates):
+        """Словарь имя события -> N, остальные события не сэмплируются."""
+        super().__init__()
+        self.rates = rates
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        """Запись проходит, если она N-я для своего события."""
+        every = self.rates.get(getattr(record.msg, 'name', None))
+        if not every or every <= 1:
+            return True
+        name = record.msg.name
+        with self.lock:
+            count = self.counters.get(name, 0)
+            self.counters[name] = count + 1
+        if count % every:
+            return False
+        record.sample_rate = every
+        return True
+
+
+class TokenBucketFilter(logging.Filter):
+    """Ограничение повторяющихся ошибок корзиной токенов на ключ события.
+
+    Число подавленных записей выводится в поле suppressed
+    следующей пропущенной записи с тем же ключом. key_fields задаёт
+    поля, по которым записи события ограничиваются раздельно.
+    """
+
+    def __init__(self, rate, burst, level=logging.WARNING,
+                 clock=time.monotonic, key_fields=None):
+        """Ключу доступно burst записей и rate новых в секунду."""
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.level = level
+        self.clock = clock
+        self.key_fields = key_fields or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def filter(self, record):
+        """Запись проходит, если в корзине её ключа есть токен."""
+        if record.levelno < self.level:
+            return True
+        key = event_key(record, self.key_fields)
+        now = self.clock()
+        with self.lock:
+            tokens, updated, suppressed = self.buckets.get(
+                key, (self.burst, now, 0)
+            )
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            if tokens < 1:
+                self.buckets[key] = (tokens, now, suppressed + 1)
+                return False
+            self.buckets[key] = (tokens - 1, now, 0)
+        record.suppressed = suppressed
+        return True
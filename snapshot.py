@@ -0,0 +1,290 @@
+import mmap
+import os
+import struct
+import time
+
+from collections import namedtuple
+
+MAGIC = b'HWSNAP01'
+HEADER = struct.Struct('<8sIIQQQ')
+HEADER_SIZE = 64
+RECORD = struct.Struct('<IB3xqqq40s')
+SEQ = struct.Struct('<I')
+SEQ_MASK = 0xFFFFFFFF
+READ_RETRIES = 1000
+TENANT_ID_SIZE = 40
+STATUSES = ('', 'reviewing', 'approved', 'rejected')
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+UNKNOWN_STATUS = 255
+UNKNOWN_STATUS_NAME = 'unknown'
+SNAPSHOT_ERROR = 'Файл {path} не является снимком статусов'
+TENANT_ID_ERROR = 'Идентификатор получателя {id} длиннее {size} байт'
+RECORD_BUSY_ERROR = 'Запись {slot} снимка {path} не дописана писателем'
+
+SnapshotRecord = namedtuple(
+    'SnapshotRecord', 'tenant_id homework_id status date_updated updated_at'
+)
+
+
+def file_size(capacity):
+    """Размер файла снимка на capacity записей."""
+    return HEADER_SIZE + capacity * RECORD.size
+
+
+def record_offset(slot):
+    """Смещение записи в файле."""
+    return HEADER_SIZE + slot * RECORD.size
+
+
+class SnapshotWriter:
+    """Запись последних статусов получателей в отображаемый в память файл.
+
+    Файл состоит из заголовка и записей фиксированного размера.
+    Запись обновляется на месте под счётчиком seqlock: нечётное
+    значение означает, что запись меняется, и читатель повторяет чтение.
+    Поколение в заголовке растёт при освобождении и повторном занятии
+    слота, новые слоты публикуются в заголовке после записи.
+    Писатель у файла один.
+    """
+
+    def __init__(self, path, capacity=1024):
+        """Существующий файл переиспользуется вместе с его записями."""
+        self.path = path
+        self.slots = {}
+        self.free = []
+        exists = os.path.exists(path)
+        self.file = open(path, 'r+b' if exists else 'w+b')
+        if exists and os.path.getsize(path) >= HEADER_SIZE:
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            self.load()
+        else:
+            self.capacity = capacity
+            self.count = 0
+            self.generation = 0
+            self.file.truncate(file_size(capacity))
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            self.write_header()
+
+    def load(self):
+        """Чтение заголовка и индекса записей существующего файла.
+
+        Нечётный счётчик остаётся от писателя, завершённого посреди
+        записи; он выравнивается, чтобы читатели не ждали его вечно.
+        """
+        magic, _, record_size, capacity, count, generation = (
+            HEADER.unpack_from(self.map)
+        )
+        if magic != MAGIC or record_size != RECORD.size:
+            self.map.close()
+            self.file.close()
+            raise ValueError(SNAPSHOT_ERROR.format(path=self.path))
+        self.capacity = capacity
+        self.count = count
+        self.generation = generation
+        for slot in range(count):
+            offset = record_offset(slot)
+            seq, *_, tenant_id = RECORD.unpack_from(self.map, offset)
+            if seq % 2:
+                SEQ.pack_into(self.map, offset, (seq + 1) & SEQ_MASK)
+            if tenant_id.strip(b'\0'):
+                self.slots[tenant_id.rstrip(b'\0').decode()] = slot
+            else:
+                self.free.append(slot)
+
+    def write_header(self):
+        """Запись заголовка с ёмкостью, числом записей и поколением."""
+        HEADER.pack_into(
+            self.map, 0, MAGIC, 1, RECORD.size, self.capacity, self.count,
+            self.generation
+        )
+
+    def grow(self):
+        """Удвоение ёмкости файла; читатели переоткрывают отображение."""
+        self.capacity *= 2
+        self.map.close()
+        self.file.truncate(file_size(self.capacity))
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.write_header()
+
+    def allocate(self, tenant_id):
+        """Слот для нового получателя, заголовок пишется после записи."""
+        if self.free:
+            slot = self.free.pop()
+            self.generation += 1
+        else:
+            if self.count == self.capacity:
+                self.grow()
+            slot = self.count
+            self.count += 1
+        self.slots[tenant_id] = slot
+        return slot
+
+    def write(self, slot, tenant_id, homework_id, status, date_updated):
+        """Запись полей слота под счётчиком seqlock.
+
+        Запись упаковывается до изменения счётчика: ошибка упаковки
+        не оставляет слот в состоянии записи.
+        """
+        offset = record_offset(slot)
+        seq = SEQ.unpack_from(self.map, offset)[0]
+        record = RECORD.pack(
+            (seq + 1) & SEQ_MASK, status, homework_id, date_updated,
+            int(time.time()), tenant_id
+        )
+        SEQ.pack_into(self.map, offset, (seq + 1) & SEQ_MASK)
+        self.map[offset:offset + RECORD.size] = record
+        SEQ.pack_into(self.map, offset, (seq + 2) & SEQ_MASK)
+
+    def update(self, tenant_id, homework):
+        """Обновление записи получателя, если статус изменился."""
+        encoded = tenant_id.encode()
+        if len(encoded) > TENANT_ID_SIZE:
+            raise ValueError(
+                TENANT_ID_ERROR.format(id=tenant_id, size=TENANT_ID_SIZE)
+            )
+        status = STATUS_CODES.get(homework.status, UNKNOWN_STATUS)
+        homework_id = homework.id or 0
+        date_updated = homework.date_updated or 0
+        slot = self.slots.get(tenant_id)
+        if slot is None:
+            slot = self.allocate(tenant_id)
+            self.write(slot, encoded, homework_id, status, date_updated)
+            self.write_header()
+            return
+        _, current_status, current_id, current_date, _, _ = (
+            RECORD.unpack_from(self.map, record_offset(slot))
+        )
+        if (current_status, current_id, current_date) != (
+                status, homework_id, date_updated):
+            self.write(slot, encoded, homework_id, status, date_updated)
+
+    def remove(self, tenant_id):
+        """Освобождение записи удалённого получателя."""
+        slot = self.slots.pop(tenant_id, None)
+        if slot is not None:
+            self.write(slot, b'', 0, 0, 0)
+            self.free.append(slot)
+            self.generation += 1
+            self.write_header()
+
+    def close(self):
+        """Сброс изменений на диск и закрытие файла."""
+        self.map.flush()
+        self.map.close()
+        self.file.close()
+
+
+class SnapshotReader:
+    """Чтение снимка статусов без запросов к API и без копирования файла.
+
+    Поля читаются struct.unpack_from прямо из отображения файла,
+    согласованность записи обеспечивает счётчик seqlock. Индекс слотов
+    дополняется новыми слотами и строится заново, только когда
+    меняется поколение снимка.
+    """
+
+    def __init__(self, path):
+        """Отображение файла только для чтения."""
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = None
+        self.index = {}
+        self.indexed = 0
+        self.generation = None
+        self.remap()
+
+    def remap(self):
+        """Переоткрытие отображения после роста файла."""
+        if self.map is not None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, _, record_size, self.capacity, _, _ = (
+            HEADER.unpack_from(self.map)
+        )
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(SNAPSHOT_ERROR.format(path=self.path))
+
+    @property
+    def count(self):
+        """Число занятых писателем слотов."""
+        capacity, count, _ = HEADER.unpack_from(self.map)[3:]
+        if capacity != self.capacity:
+            self.remap()
+        return count
+
+    def view(self, slot):
+        """Байты записи слота без копирования."""
+        offset = record_offset(slot)
+        return memoryview(self.map)[offset:offset + RECORD.size]
+
+    def read(self, slot):
+        """Согласованное чтение записи слота или None для пустого.
+
+        После READ_RETRIES попыток застать запись неизменной
+        выбрасывается ValueError.
+        """
+        offset = record_offset(slot)
+        for _ in range(READ_RETRIES):
+            fields = RECORD.unpack_from(self.map, offset)
+            seq = fields[0]
+            if seq % 2 == 0 and SEQ.unpack_from(self.map, offset)[0] == seq:
+                break
+            time.sleep(0)
+        else:
+            raise ValueError(
+                RECORD_BUSY_ERROR.format(slot=slot, path=self.path)
+            )
+        _, status, homework_id, date_updated, updated_at, tenant_id = fields
+        tenant_id = tenant_id.rstrip(b'\0')
+        if not tenant_id:
+            return None
+        return SnapshotRecord(
+            tenant_id.decode(),
+            homework_id or None,
+            (
+                STATUSES[status] if status < len(STATUSES)
+                else UNKNOWN_STATUS_NAME
+            ) or None,
+            date_updated or None,
+            updated_at,
+        )
+
+    def records(self):
+        """Все непустые записи снимка."""
+        for slot in range(self.count):
+            record = self.read(slot)
+            if record is not None:
+                yield record
+
+    def update_index(self):
+        """Индексация слотов, добавленных с прошлого обновления.
+
+        Поколение читается после числа слотов: запись, занятая после
+        чтения поколения, будет найдена при следующем обновлении.
+        """
+        count = self.count
+        generation = HEADER.unpack_from(self.map)[5]
+        if generation != self.generation:
+            self.index = {}
+            self.indexed = 0
+            self.generation = generation
+        for slot in range(self.indexed, count):
+            record = self.read(slot)
+            if record is not None:
+                self.index[record.tenant_id] = slot
+        self.indexed = count
+
+    def get(self, tenant_id):
+        """Запись получателя; индекс слотов обновляется при промахе."""
+        slot = self.index.get(tenant_id)
+        record = self.read(slot) if slot is not None else None
+        if record is not None and record.tenant_id == tenant_id:
+            return record
+        self.update_index()
+        slot = self.index.get(tenant_id)
+        return self.read(slot) if slot is not None else None
+
+    def close(self):
+        """Закрытие отображения и файла."""
+        self.map.close()
+        self.file.close()
@@ -0,0 +1,17 @@
+def create_client(token, pool_size=1, connect_timeout=5.0, read_timeout=5.0,
+                  base_url=None):
+    """Бот Telegram с общим пулом соединений.
+
+    Соединения пула переиспользуются между запросами (keep-alive), пока
+    одновременных запросов не больше pool_size: лишние соединения
+    urllib3 закрывает после ответа.
+    """
+    from telegram import Bot
+    from telegram.utils.request import Request
+
+    request = Request(
+        con_pool_size=pool_size,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+    )
+    return Bot(token=token, base_url=base_url, request=request)
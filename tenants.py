@@ -0,0 +1,156 @@
+import json
+import os
+import signal
+import time
+
+from collections import namedtuple
+
+TENANTS_KEY = 'tenants'
+SIGNAL_CHECK_INTERVAL = 1.0
+REQUIRED_FIELDS = ('id', 'practicum_token', 'chat_id')
+CONFIG_NOT_READABLE = 'Не удалось прочитать файл получателей {path}: {error}'
+CONFIG_NOT_LIST = 'В файле {path} под ключом "{key}" ожидается {type}'
+TENANT_NOT_DICT = 'Получатель #{index} не в формате {type}'
+TENANT_KEY_MISSING = 'У получателя #{index} отсутствует ключ {key}'
+TENANT_DUPLICATE = 'Получатель {id} указан несколько раз'
+CONFIG_ERRORS = 'Ошибки в файле получателей {path}: {errors}'
+
+TenantDiff = namedtuple('TenantDiff', 'added removed changed')
+
+
+class TenantConfigError(Exception):
+    """Исключение для некорректного файла получателей."""
+
+    pass
+
+
+class Tenant:
+    """Получатель уведомлений: токен Практикума, чат Telegram и локаль."""
+
+    __slots__ = ('id', 'practicum_token', 'chat_id', 'locale')
+
+    def __init__(self, id, practicum_token, chat_id, locale=None):
+        """Идентификатор получателя уникален в пределах файла."""
+        self.id = id
+        self.practicum_token = practicum_token
+        self.chat_id = chat_id
+        self.locale = locale
+
+    @property
+    def headers(self):
+        """Заголовки запроса к API от имени получателя."""
+        return {'Authorization': f'OAuth {self.practicum_token}'}
+
+    def astuple(self):
+        """Поля получателя для сравнения при перезагрузке."""
+        return self.id, self.practicum_token, self.chat_id, self.locale
+
+
+def parse_tenants(data, path):
+    """Проверка всех записей файла сразу и сборка получателей."""
+    entries = data.get(TENANTS_KEY) if isinstance(data, dict) else None
+    if not isinstance(entries, list):
+        raise TenantConfigError(
+            CONFIG_NOT_LIST.format(path=path, key=TENANTS_KEY, type=list)
+        )
+    tenants = {}
+    errors = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(TENANT_NOT_DICT.format(index=index, type=dict))
+            continue
+        missing = [key for key in REQUIRED_FIELDS if not entry.get(key)]
+        if missing:
+            errors.append(TENANT_KEY_MISSING.format(index=index, key=missing))
+            continue
+        tenant = Tenant(
+            str(entry['id']), entry['practicum_token'], entry['chat_id'],
+            entry.get('locale')
+        )
+        if tenant.id in tenants:
+            errors.append(TENANT_DUPLICATE.format(id=tenant.id))
+            continue
+        tenants[tenant.id] = tenant
+    if errors:
+        raise TenantConfigError(
+            CONFIG_ERRORS.format(path=path, errors='; '.join(errors))
+        )
+    return tenants
+
+
+class TenantRegistry:
+    """Список получателей с перезагрузкой файла по изменению."""
+
+    def __init__(self, path=None, tenants=()):
+        """Без файла реестр содержит только переданных получателей."""
+        self.path = path
+        self.static = {tenant.id: tenant for tenant in tenants}
+        self.tenants = {}
+        self.signature = None
+        self.reload_requested = False
+
+    def install_signal_handler(self, signum=getattr(signal, 'SIGHUP', None)):
+        """Принудительная перезагрузка файла по сигналу."""
+        if signum is not None:
+            signal.signal(signum, self.request_reload)
+
+    def request_reload(self, *args):
+        """Перечитать файл при следующем вызове reload()."""
+        self.reload_requested = True
+
+    def wait(self, timeout, interval=SIGNAL_CHECK_INTERVAL):
+        """Ожидание timeout секунд или запроса перезагрузки.
+
+        Обработчик сигнала только ставит флаг, а time.sleep после него
+        продолжает спать, поэтому флаг проверяется каждые interval
+        секунд. Возвращает True, если пришёл запрос перезагрузки.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.reload_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+        return True
+
+    def reload(self):
+        """Перечитывание файла, если он изменился или пришёл сигнал."""
+        if self.path is None:
+            return self.update(self.static)
+        requested, self.reload_requested = self.reload_requested, False
+        try:
+            stat = os.stat(self.path)
+        except OSError as error:
+            raise TenantConfigError(
+                CONFIG_NOT_READABLE.format(path=self.path, error=error)
+            )
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self.signature and not requested:
+            return TenantDiff([], [], [])
+        self.signature = signature
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as error:
+            raise TenantConfigError(
+                CONFIG_NOT_READABLE.format(path=self.path, error=error)
+            )
+        return self.update(parse_tenants(data, self.path))
+
+    def update(self, tenants):
+        """Замена списка получателей с вычислением разницы."""
+        current = self.tenants
+        added = [
+            tenant for tenant_id, tenant in tenants.items()
+            if tenant_id not in current
+        ]
+        removed = [
+            tenant_id for tenant_id in current if tenant_id not in tenants
+        ]
+        changed = [
+            tenant for tenant_id, tenant in tenants.items()
+            if tenant_id in current
+            and current[tenant_id].astuple() != tenant.astuple()
+        ]
+        self.tenants = tenants
+        return TenantDiff(added, removed, changed)
@@ -0,0 +1,39 @@
+import pytest
+
+
+def bot_factory():
+    return 'bot'
+
+
+def process(bot, tenant, state):
+    state.prev_message = f'{bot}:{tenant.id}'
+
+
+class TestEngine:
+
+    @pytest.mark.parametrize(
+        'name', ['sequential', 'threads', 'asyncio', 'processes']
+    )
+    def test_engine_runs_pipeline(self, name):
+        import engine
+        import homework
+
+        jobs = [
+            (homework.Tenant(str(i), 'token', i), homework.TenantState(i))
+            for i in range(10)
+        ]
+        poll_engine = engine.create_engine(name, bot_factory, process, 2)
+        try:
+            states = poll_engine.run(jobs)
+        finally:
+            poll_engine.close()
+        assert [state.prev_message for state in states] == [
+            f'bot:{i}' for i in range(10)
+        ], f'Движок `{name}` должен вернуть состояния в порядке заданий'
+        assert [state.timestamp for state in states] == list(range(10))
+
+    def test_unknown_engine(self):
+        import engine
+
+        with pytest.raises(ValueError):
+            engine.create_engine('fibers', bot_factory, process)
@@ -0,0 +1,73 @@
+class MockBot:
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        pass
+
+
+class TestFreshness:
+
+    def test_percentiles(self):
+        from freshness import FreshnessTracker
+
+        tracker = FreshnessTracker(clock=lambda: 1000)
+        for delay in range(1, 101):
+            tracker.record('alice', delay, cursor=900)
+        tracker.record('bob', 500)
+
+        summary = tracker.summary()
+        assert (summary['count'], summary['p50'], summary['p99']) == (
+            101, 51, 100
+        )
+        alice = tracker.summary('alice')
+        assert alice['count'] == 32, (
+            'По получателю хранится ограниченное число последних замеров'
+        )
+        assert (alice['p50'], alice['cursor'], alice['cursor_age']) == (
+            84, 900, 100
+        )
+        assert tracker.summary('carol') == {'count': 0}
+
+        tracker.remove('alice')
+        assert tracker.summary('alice') == {'count': 0}
+
+    def test_alerts(self):
+        from freshness import FreshnessTracker
+
+        alerts = []
+        tracker = FreshnessTracker(
+            threshold=60, on_alert=lambda *args: alerts.append(args)
+        )
+        tracker.record('alice', 30)
+        tracker.record('bob', 90)
+        assert alerts == [('bob', 90)], (
+            'Предупреждение только при превышении порога'
+        )
+        assert tracker.summary()['tenants_over_threshold'] == 1
+
+    def test_check_updates_measures_delay(self, monkeypatch):
+        import homework
+        from freshness import FreshnessTracker
+
+        monkeypatch.setattr(
+            homework, 'get_tenant_answer', lambda ts, headers: {
+                'homeworks': [{
+                    'homework_name': 'hw123',
+                    'status': 'approved',
+                    'date_updated': '2020-02-13T14:40:57Z',
+                }],
+                'current_date': 1581604900,
+            }
+        )
+        monkeypatch.setattr(homework.time, 'time', lambda: 1581604917)
+        tenant = homework.Tenant('alice', 'token', 1)
+        states = {'alice': homework.TenantState(0)}
+        homework.check_updates(MockBot(), tenant, states['alice'])
+        assert states['alice'].delay == 60, (
+            'Задержка считается от date_updated до отправки сообщения'
+        )
+
+        tracker = FreshnessTracker()
+        homework.record_freshness(tracker, states)
+        assert states['alice'].delay is None
+        assert tracker.summary('alice')['p50'] == 60
+        assert tracker.summary('alice')['cursor'] == 1581604900
@@ -0,0 +1,195 @@
+import json
+import urllib.error
+import urllib.request
+
+
+def get(port, path):
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}{path}') as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as error:
+        if error.headers.get_content_type() != 'application/json':
+            return error.code, None
+        return error.code, json.loads(error.read())
+
+
+class TestLiveness:
+
+    def test_watchdog_detects_stall_once(self):
+        from liveness import Watchdog
+
+        now = [0.0]
+        stalls = []
+        watchdog = Watchdog(
+            10, on_stall=lambda *args: stalls.append(args),
+            clock=lambda: now[0]
+        )
+        watchdog.beat('poll')
+        now[0] = 5
+        assert watchdog.check() == []
+        now[0] = 11
+        assert watchdog.check() == ['poll']
+        assert watchdog.check() == [], (
+            'О зависании нужно сообщать один раз'
+        )
+        name, age, stacks = stalls[0]
+        assert (name, age) == ('poll', 11)
+        assert 'test_watchdog_detects_stall_once' in stacks, (
+            'При зависании нужно выводить стеки потоков'
+        )
+
+        watchdog.success('poll')
+        assert watchdog.status() == {'stalled': [], 'last_poll_age': 0}
+
+    def test_success_during_check(self):
+        from liveness import Watchdog
+
+        now = [0.0]
+        stalls = []
+
+        def on_stall(name, age, stacks):
+            stalls.append((name, age))
+            watchdog.success('send')
+
+        watchdog = Watchdog(10, on_stall=on_stall, clock=lambda: now[0])
+        watchdog.beat('poll')
+        watchdog.beat('send')
+        now[0] = 11
+        assert watchdog.check() == ['poll', 'send'], (
+            'Завершение работы во время проверки не должно ломать её'
+        )
+        assert stalls == [('poll', 11), ('send', 11)]
+
+    def test_run_survives_errors(self):
+        import threading
+
+        from liveness import Watchdog
+
+        calls = []
+        errors = []
+        done = threading.Event()
+
+        def on_stall(name, age, stacks):
+            calls.append(name)
+            if len(calls) == 1:
+                raise RuntimeError('сбой обработчика')
+            done.set()
+
+        watchdog = Watchdog(
+            0.01, on_stall=on_stall, interval=0.01, on_error=errors.append
+        )
+        watchdog.start()
+        watchdog.beat('poll')
+        watchdog.beat('send')
+        try:
+            assert done.wait(2), (
+                'Ошибка проверки не должна останавливать поток watchdog'
+            )
+        finally:
+            watchdog.stop()
+        assert [type(error) for error in errors] == [RuntimeError], (
+            'Ошибка проверки передаётся в on_error'
+        )
+
+    def test_watchdog_error_event(self, caplog):
+        import homework
+
+        watchdog = homework.create_watchdog(None)
+        watchdog.stop()
+        assert watchdog.on_error is homework.handle_watchdog_error
+        try:
+            raise RuntimeError('сбой обработчика')
+        except RuntimeError as error:
+            watchdog.on_error(error)
+        record = caplog.records[-1]
+        assert record.name == homework.logger.name and (
+            record.msg.name == 'watchdog_error'
+        ), 'Ошибки watchdog пишутся событием в лог бота'
+        assert record.exc_info is not None
+
+    def test_health_endpoints(self):
+        from liveness import Watchdog, serve_health
+
+        now = [0.0]
+        watchdog = Watchdog(10, clock=lambda: now[0])
+        server = serve_health(watchdog, 0, ready_age=60, host='127.0.0.1')
+        port = server.server_address[1]
+        try:
+            assert get(port, '/healthz')[0] == 200
+            assert get(port, '/readyz')[0] == 503, (
+                'До первого опроса бот не готов'
+            )
+
+            watchdog.beat('poll')
+            watchdog.success('poll')
+            now[0] = 30
+            status, body = get(port, '/readyz')
+            assert status == 200 and body['last_poll_age'] == 30
+
+            watchdog.beat('poll')
+            now[0] = 50
+            watchdog.check()
+            status, body = get(port, '/healthz')
+            assert status == 503 and body['stalled'] == ['poll']
+
+            assert get(port, '/metrics')[0] == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_extra_routes(self):
+        from liveness import Watchdog, serve_health
+
+        server = serve_health(
+            Watchdog(10), 0, ready_age=60, host='127.0.0.1',
+            routes={'/freshness': lambda query: {'tenant': query.get('tenant')}}
+        )
+        port = server.server_address[1]
+        try:
+            status, body = get(port, '/freshness?tenant=alice')
+            assert status == 200 and body['tenant'] == 'alice'
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_failed_polls_are_not_ready(self, monkeypatch):
+        import homework
+        from engine import SequentialEngine
+        from liveness import Watchdog, serve_health
+        from tenants import TenantRegistry
+
+        class MockBot:
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                pass
+
+        def fail(ts, headers):
+            raise ConnectionError('API недоступен')
+
+        monkeypatch.setattr(homework, 'get_tenant_answer', fail)
+        registry = TenantRegistry(tenants=[
+            homework.Tenant('alice', 'token', 1)
+        ])
+        registry.reload()
+        states = {'alice': homework.TenantState(0)}
+        engine = SequentialEngine(MockBot, homework.check_updates)
+
+        now = [0.0]
+        watchdog = Watchdog(10, clock=lambda: now[0])
+        server = serve_health(watchdog, 0, ready_age=60, host='127.0.0.1')
+        port = server.server_address[1]
+        try:
+            watchdog.success('poll')
+            for _ in range(3):
+                now[0] += 30
+                assert homework.run_poll(
+                    engine, registry, states, watchdog
+                ) == 0
+            status, body = get(port, '/readyz')
+            assert status == 503 and body['last_poll_age'] == 90, (
+                'Цикл, в котором API не ответил, не считается успешным'
+            )
+            assert get(port, '/healthz')[0] == 200
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,121 @@
+import json
+import logging
+from http import HTTPStatus
+
+import pytest
+import requests
+
+
+def make_record(msg, level=logging.ERROR):
+    return logging.LogRecord(
+        'homework', level, __file__, 1, msg, None, None
+    )
+
+
+class TestLogEvents:
+
+    def test_event_is_lazy(self):
+        from log_events import Event
+
+        class Field:
+            formatted = 0
+
+            def __format__(self, spec):
+                Field.formatted += 1
+                return 'поле'
+
+        event = Event('message_sent', 'Сообщение {message}', message=Field())
+        assert Field.formatted == 0, (
+            'Шаблон события не должен форматироваться до вывода записи'
+        )
+        assert str(event) == 'Сообщение поле'
+
+    def test_json_formatter(self):
+        from log_events import Event, JsonFormatter
+
+        error = ValueError('неизвестный статус')
+        record = make_record(Event(
+            'poll_error', 'Сбой {error}', error=error, tenant='alice'
+        ))
+        payload = json.loads(JsonFormatter().format(record))
+        assert payload['event'] == 'poll_error'
+        assert payload['fields'] == {
+            'error': 'ValueError: неизвестный статус', 'tenant': 'alice'
+        }
+        assert payload['level'] == 'ERROR'
+
+    def test_sampling_filter(self):
+        from log_events import Event, SamplingFilter, parse_sampling
+
+        sampling = SamplingFilter(parse_sampling('message_sent=10'))
+        passed = [
+            sampling.filter(make_record(Event('message_sent', '')))
+            for _ in range(100)
+        ]
+        assert sum(passed) == 10
+        assert all(
+            sampling.filter(make_record(Event('poll_error', '')))
+            for _ in range(100)
+        ), 'События без настройки не должны сэмплироваться'
+
+    def test_parse_sampling_error(self):
+        from log_events import parse_sampling
+
+        with pytest.raises(ValueError):
+            parse_sampling('message_sent=часто')
+
+    def test_token_bucket_filter(self):
+        from log_events import Event, TokenBucketFilter
+
+        now = [0.0]
+        limiter = TokenBucketFilter(1, 3, clock=lambda: now[0])
+
+        def error(exception):
+            return make_record(Event('poll_error', '', error=exception))
+
+        passed = [limiter.filter(error(ConnectionError())) for _ in range(10)]
+        assert sum(passed) == 3, (
+            'Повторяющиеся ошибки должны ограничиваться корзиной токенов'
+        )
+        assert limiter.filter(error(TypeError())), (
+            'Ошибки другого типа ограничиваются отдельно'
+        )
+        assert limiter.filter(make_record(Event('message_sent', ''),
+                                          logging.INFO))
+
+        now[0] = 1.0
+        record = error(ConnectionError())
+        assert limiter.filter(record)
+        assert record.suppressed == 7
+
+    def test_token_bucket_key_fields(self):
+        from log_events import Event, TokenBucketFilter
+
+        limiter = TokenBucketFilter(
+            0, 1, clock=lambda: 0.0,
+            key_fields={'freshness_alert': ('tenant',)}
+        )
+
+        def alert(tenant):
+            return make_record(Event('freshness_alert', '', tenant=tenant))
+
+        assert limiter.filter(alert('alice'))
+        assert limiter.filter(alert('bob')), (
+            'Предупреждения разных получателей ограничиваются раздельно'
+        )
+        assert not limiter.filter(alert('alice'))
+
+    def test_api_error_hides_token(self, monkeypatch):
+        import homework
+
+        class Response:
+            status_code = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        monkeypatch.setattr(requests, 'get', lambda **kwargs: Response())
+        with pytest.raises(homework.NoSuccessfulResponse) as error:
+            homework.get_tenant_answer(
+                0, {'Authorization': 'OAuth secret-token'}
+            )
+        assert 'secret-token' not in str(error.value), (
+            'Токен не должен попадать в текст ошибки'
+        )
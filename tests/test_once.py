@@ -0,0 +1,108 @@
+import telegram
+
+
+class MockBot:
+
+    def __init__(self, token=None, **kwargs):
+        self.sent = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        self.sent.append((chat_id, text))
+
+
+def api_answer(status='approved', current_date=200):
+    return {
+        'homeworks': [{'homework_name': 'hw123', 'status': status}],
+        'current_date': current_date,
+    }
+
+
+class TestOnce:
+
+    def test_check_updates_sends_once(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(
+            homework, 'get_tenant_answer', lambda ts, headers: api_answer()
+        )
+        bot = MockBot()
+        tenant = homework.Tenant('alice', 'sometoken', 12345)
+        state = homework.TenantState(100)
+        homework.check_updates(bot, tenant, state)
+        homework.check_updates(bot, tenant, state)
+        assert bot.sent == [(12345, homework.parse_status(state.homework))], (
+            'Повторный статус не должен отправляться второй раз'
+        )
+        assert state.timestamp == 200, (
+            'После отправки курсор должен сдвигаться на `current_date`'
+        )
+
+    def test_state_roundtrip(self, tmp_path):
+        import homework
+
+        path = str(tmp_path / 'state.json')
+        assert homework.load_states(path) == {}
+        homework.save_states(
+            path, {'alice': homework.TenantState(42, 'сообщение')}
+        )
+        state = homework.load_states(path)['alice']
+        assert (state.timestamp, state.prev_message) == (42, 'сообщение')
+
+    def test_main_once(self, monkeypatch, tmp_path):
+        import homework
+
+        bots = []
+
+        def mock_bot(*args, **kwargs):
+            bots.append(MockBot(*args, **kwargs))
+            return bots[-1]
+
+        path = str(tmp_path / 'state.json')
+        monkeypatch.setattr(telegram, 'Bot', mock_bot)
+        monkeypatch.setattr(homework, 'STATE_FILE', path)
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(
+            homework, 'get_tenant_answer', lambda ts, headers: api_answer()
+        )
+
+        assert homework.main(once=True) is None
+        assert homework.main(once=True) is None
+        assert len(bots[0].sent) == 1 and not bots[1].sent, (
+            'Режим `--once` должен учитывать сохранённое состояние'
+        )
+        states = homework.load_states(path)
+        assert states[homework.DEFAULT_TENANT_ID].timestamp == 200
+
+    def test_main_health_port_busy(self, monkeypatch, caplog):
+        import socket
+
+        import homework
+
+        class MockEngine:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        engine = MockEngine()
+        busy = socket.socket()
+        busy.bind(('', 0))
+        busy.listen()
+        monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        monkeypatch.setattr(homework, 'HEALTH_PORT', busy.getsockname()[1])
+        monkeypatch.setattr(homework, 'create_engine', lambda *args: engine)
+        try:
+            assert homework.main(once=True) is None
+        finally:
+            busy.close()
+        assert engine.closed, (
+            'Занятый порт проверок не должен оставлять движок открытым'
+        )
+        assert any(
+            getattr(record.msg, 'name', None) == 'config_invalid'
+            for record in caplog.records
+        )
@@ -0,0 +1,82 @@
+import pytest
+
+
+class TestRecords:
+
+    def test_homework_from_dict(self):
+        import homework
+
+        record = homework.Homework.from_dict({
+            'id': 123,
+            'status': 'approved',
+            'homework_name': 'hw123',
+            'date_updated': '2020-02-13T14:40:57Z',
+        })
+        assert (record.id, record.name, record.status) == (
+            123, 'hw123', 'approved'
+        ), 'Проверьте, что запись заполняется из словаря ответа API'
+        assert record.date_updated == 1581604857, (
+            'Проверьте, что дата обновления переводится в секунды эпохи'
+        )
+        assert not hasattr(record, '__dict__'), (
+            'Запись о работе должна использовать `__slots__`'
+        )
+
+    def test_homework_from_dict_bad_date(self):
+        import homework
+
+        record = homework.Homework.from_dict({
+            'status': 'approved',
+            'homework_name': 'hw123',
+            'date_updated': 'вчера',
+        })
+        assert record.date_updated is None
+
+    def test_homework_from_dict_no_name(self):
+        import homework
+
+        with pytest.raises(KeyError):
+            homework.Homework.from_dict({'status': 'approved'})
+
+    @pytest.mark.parametrize('status', [None, 5])
+    def test_homework_from_dict_not_str_status(self, monkeypatch, status):
+        import homework
+
+        record = homework.Homework.from_dict(
+            {'status': status, 'homework_name': 'hw123'}
+        )
+        assert record.status == status
+        with pytest.raises(ValueError):
+            homework.parse_status(record)
+
+        monkeypatch.setattr(
+            homework, 'HOMEWORK_VERDICT_FALLBACK', 'Новый статус: {status}.'
+        )
+        homework.get_catalogs.cache_clear()
+        homework.render_status.cache_clear()
+        try:
+            assert homework.parse_status(record).endswith(
+                f'Новый статус: {status}.'
+            ), 'Для статуса не строкой применяется общий вердикт'
+        finally:
+            homework.get_catalogs.cache_clear()
+            homework.render_status.cache_clear()
+
+    def test_parse_status_record(self):
+        import homework
+
+        record = homework.Homework(1, 'hw123', 'reviewing')
+        assert homework.parse_status(record) == homework.parse_status(
+            {'homework_name': 'hw123', 'status': 'reviewing'}
+        )
+
+    def test_tenant_state_slots(self):
+        import homework
+
+        state = homework.TenantState(100)
+        assert (state.timestamp, state.prev_message, state.homework) == (
+            100, '', None
+        )
+        assert not hasattr(state, '__dict__'), (
+            'Состояние получателя должно использовать `__slots__`'
+        )
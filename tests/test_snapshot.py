@@ -0,0 +1,227 @@
+import pytest
+
+
+class TestSnapshot:
+
+    def test_write_and_read(self, tmp_path):
+        import homework
+        from snapshot import SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path, capacity=2)
+        reader = SnapshotReader(path)
+        try:
+            for i in range(5):
+                writer.update(f'tenant-{i}', homework.Homework(
+                    i + 1, 'hw', 'reviewing', 1581604857
+                ))
+            writer.update('tenant-1', homework.Homework(2, 'hw', 'approved'))
+            writer.update('tenant-2', homework.Homework(3, 'hw', 'new'))
+
+            record = reader.get('tenant-1')
+            assert (record.homework_id, record.status) == (2, 'approved'), (
+                'Читатель должен видеть обновление без переоткрытия файла'
+            )
+            assert reader.get('tenant-2').status == 'unknown'
+            assert reader.get('tenant-4').date_updated == 1581604857, (
+                'Читатель должен видеть записи после роста файла'
+            )
+            assert reader.get('nobody') is None
+
+            writer.remove('tenant-0')
+            assert reader.get('tenant-0') is None
+            assert len(list(reader.records())) == 4
+        finally:
+            reader.close()
+            writer.close()
+
+    def test_reopen_keeps_slots(self, tmp_path):
+        import homework
+        from snapshot import SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        writer.update('alice', homework.Homework(1, 'hw', 'approved'))
+        writer.update('bob', homework.Homework(2, 'hw', 'rejected'))
+        writer.remove('alice')
+        writer.close()
+
+        writer = SnapshotWriter(path)
+        writer.update('carol', homework.Homework(3, 'hw', 'reviewing'))
+        writer.update('bob', homework.Homework(2, 'hw', 'approved'))
+        assert writer.count == 2, 'Освобождённые слоты переиспользуются'
+        writer.close()
+
+        reader = SnapshotReader(path)
+        assert sorted(
+            (record.tenant_id, record.status) for record in reader.records()
+        ) == [('bob', 'approved'), ('carol', 'reviewing')]
+        reader.close()
+
+    def test_seqlock_counter(self, tmp_path):
+        import homework
+        from snapshot import RECORD, SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        reader = SnapshotReader(path)
+        writer.update('alice', homework.Homework(1, 'hw', 'reviewing'))
+        writer.update('alice', homework.Homework(1, 'hw', 'reviewing'))
+        view = reader.view(0)
+        assert RECORD.unpack_from(view)[0] == 2, (
+            'Неизменённый статус не должен перезаписываться'
+        )
+        view.release()
+        reader.close()
+        writer.close()
+
+    def test_long_tenant_id(self, tmp_path):
+        import homework
+        from snapshot import SnapshotWriter
+
+        writer = SnapshotWriter(str(tmp_path / 'statuses.snap'))
+        with pytest.raises(ValueError):
+            writer.update('x' * 41, homework.Homework(1, 'hw', 'approved'))
+        writer.close()
+
+    def test_not_a_snapshot(self, tmp_path):
+        from snapshot import SnapshotReader, SnapshotWriter
+
+        path = tmp_path / 'statuses.snap'
+        path.write_bytes(b'\0' * 128)
+        with pytest.raises(ValueError):
+            SnapshotWriter(str(path))
+        with pytest.raises(ValueError):
+            SnapshotReader(str(path))
+
+    def test_failed_write_keeps_record_readable(self, tmp_path):
+        import struct
+
+        import homework
+        from snapshot import RECORD, SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        reader = SnapshotReader(path)
+        writer.update('alice', homework.Homework(1, 'hw', 'reviewing'))
+        with pytest.raises(struct.error):
+            writer.update('alice', homework.Homework('x', 'hw', 'approved'))
+        view = reader.view(0)
+        assert RECORD.unpack_from(view)[0] % 2 == 0, (
+            'Ошибка упаковки не должна оставлять нечётный счётчик'
+        )
+        view.release()
+        assert reader.get('alice').status == 'reviewing'
+        reader.close()
+        writer.close()
+
+    def test_interrupted_write(self, tmp_path):
+        import homework
+        from snapshot import HEADER_SIZE, SEQ, SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        writer.update('alice', homework.Homework(1, 'hw', 'reviewing'))
+        SEQ.pack_into(writer.map, HEADER_SIZE, 3)
+        writer.close()
+
+        reader = SnapshotReader(path)
+        with pytest.raises(ValueError):
+            list(reader.records())
+        reader.close()
+
+        SnapshotWriter(path).close()
+        reader = SnapshotReader(path)
+        assert reader.get('alice').status == 'reviewing', (
+            'Писатель при открытии выравнивает счётчик прерванной записи'
+        )
+        reader.close()
+
+    def test_update_snapshot_skips_bad_homework(self, tmp_path):
+        import homework
+        from snapshot import SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        homework.update_snapshot(writer, {
+            'alice': homework.TenantState(
+                0, homework=homework.Homework('x', 'hw', 'approved')
+            ),
+            'bob': homework.TenantState(
+                0, homework=homework.Homework(2, 'hw', 'approved')
+            ),
+        })
+        reader = SnapshotReader(path)
+        assert [record.tenant_id for record in reader.records()] == ['bob'], (
+            'Некорректная работа одного получателя не мешает остальным'
+        )
+        reader.close()
+        writer.close()
+
+    def test_miss_reads_only_new_slots(self, tmp_path):
+        import homework
+        from snapshot import SnapshotReader, SnapshotWriter
+
+        path = str(tmp_path / 'statuses.snap')
+        writer = SnapshotWriter(path)
+        reader = SnapshotReader(path)
+        for i in range(100):
+            writer.update(f'tenant-{i}', homework.Homework(i, 'hw', 'new'))
+        assert reader.get('nobody') is None
+
+        reads = []
+        read = reader.read
+        reader.read = lambda slot: reads.append(slot) or read(slot)
+        assert reader.get('nobody') is None
+        assert reads == [], 'Повторный промах не должен читать все слоты'
+
+        writer.update('carol', homework.Homework(1, 'hw', 'approved'))
+        assert reader.get('carol').status == 'approved'
+        assert reads == [100, 100]
+
+        writer.remove('tenant-5')
+        writer.update('dave', homework.Homework(2, 'hw', 'approved'))
+        assert reader.get('dave').status == 'approved', (
+            'Получатель в освобождённом слоте должен находиться'
+        )
+        reader.close()
+        writer.close()
+
+    def test_main_prunes_removed_tenants(self, monkeypatch, tmp_path):
+        import json
+
+        import homework
+        from snapshot import SnapshotReader
+
+        class MockBot:
+
+            def send_message(self, chat_id=None, text=None, **kwargs):
+                pass
+
+        tenants_file = tmp_path / 'tenants.json'
+        snapshot_file = str(tmp_path / 'statuses.snap')
+        monkeypatch.setattr(homework, 'TENANTS_FILE', str(tenants_file))
+        monkeypatch.setattr(homework, 'SNAPSHOT_FILE', snapshot_file)
+        monkeypatch.setattr(
+            homework, 'STATE_FILE', str(tmp_path / 'state.json')
+        )
+        monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework, 'create_bot', MockBot)
+        monkeypatch.setattr(
+            homework, 'get_tenant_answer', lambda ts, headers: {
+                'homeworks': [{'homework_name': 'hw', 'status': 'approved'}],
+                'current_date': ts,
+            }
+        )
+        for ids in (['alice', 'bob'], ['alice']):
+            tenants_file.write_text(json.dumps({'tenants': [
+                {'id': tenant_id, 'practicum_token': 'token', 'chat_id': 1}
+                for tenant_id in ids
+            ]}), encoding='utf-8')
+            assert homework.main(once=True) is None
+
+        reader = SnapshotReader(snapshot_file)
+        assert [record.tenant_id for record in reader.records()] == [
+            'alice'
+        ], 'Получатели, удалённые между запусками, удаляются из снимка'
+        reader.close()
@@ -0,0 +1,58 @@
+import threading
+import time
+
+
+class TestTelegramClient:
+
+    def test_create_client_pool(self):
+        from telegram_client import create_client
+
+        bot = create_client(
+            '1234:abcdefg', pool_size=8, connect_timeout=1, read_timeout=2,
+            base_url='http://127.0.0.1:1/bot'
+        )
+        assert bot.request.con_pool_size == 8, (
+            'Размер пула соединений должен настраиваться'
+        )
+        assert bot.base_url == 'http://127.0.0.1:1/bot1234:abcdefg'
+
+    def test_send_many_concurrent(self):
+        from benchmarks.sends import send_many
+
+        active = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def send(bot, chat_id, text):
+            with lock:
+                active.append(chat_id)
+                peak[0] = max(peak[0], len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(chat_id)
+            return f'{bot}:{chat_id}:{text}'
+
+        messages = [(i, 'текст') for i in range(20)]
+        results = send_many('bot', messages, send, workers=4)
+        assert results == [f'bot:{i}:текст' for i in range(20)]
+        assert 1 < peak[0] <= 4, (
+            'Отправка должна идти одновременно, но не больше workers потоков'
+        )
+
+    def test_fake_bot_api_roundtrip(self):
+        from benchmarks.sends import TOKEN, send_many, start_fake_bot_api
+        from homework import send_tenant_message
+        from telegram_client import create_client
+
+        server, base_url = start_fake_bot_api()
+        try:
+            bot = create_client(TOKEN, pool_size=4, base_url=base_url)
+            messages = [(1, f'сообщение {i}') for i in range(12)]
+            assert all(send_many(bot, messages, send_tenant_message, 4))
+            assert server.messages == 12
+            assert server.connections <= 4, (
+                'Соединения пула должны переиспользоваться'
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
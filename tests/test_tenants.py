@@ -0,0 +1,137 @@
+import json
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+
+def write_tenants(path, tenants, mtime=None):
+    path.write_text(json.dumps({'tenants': tenants}), encoding='utf-8')
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+TENANTS = [
+    {'id': 'alice', 'practicum_token': 'token-a', 'chat_id': 1},
+    {'id': 'bob', 'practicum_token': 'token-b', 'chat_id': 2},
+]
+
+
+class TestTenantRegistry:
+
+    def test_reload_applies_diff(self, tmp_path):
+        import tenants
+
+        path = tmp_path / 'tenants.json'
+        write_tenants(path, TENANTS, mtime=1)
+        registry = tenants.TenantRegistry(str(path))
+
+        diff = registry.reload()
+        assert [tenant.id for tenant in diff.added] == ['alice', 'bob']
+        assert registry.reload() == ([], [], []), (
+            'Неизменённый файл не должен перечитываться'
+        )
+
+        write_tenants(path, [
+            {'id': 'alice', 'practicum_token': 'token-a2', 'chat_id': 1},
+            {'id': 'carol', 'practicum_token': 'token-c', 'chat_id': 3},
+        ], mtime=2)
+        diff = registry.reload()
+        assert [tenant.id for tenant in diff.added] == ['carol']
+        assert diff.removed == ['bob']
+        assert [tenant.id for tenant in diff.changed] == ['alice']
+
+    def test_request_reload(self, tmp_path):
+        import tenants
+
+        path = tmp_path / 'tenants.json'
+        write_tenants(path, TENANTS, mtime=1)
+        registry = tenants.TenantRegistry(str(path))
+        registry.reload()
+        write_tenants(path, TENANTS[:1], mtime=1)
+        registry.request_reload()
+        assert registry.reload().removed == ['bob'], (
+            'Сигнал должен перечитывать файл независимо от mtime'
+        )
+
+    @pytest.mark.skipif(
+        not hasattr(signal, 'SIGHUP'), reason='нужен сигнал SIGHUP'
+    )
+    def test_signal_wakes_wait(self, monkeypatch, tmp_path):
+        import homework
+
+        path = tmp_path / 'tenants.json'
+        write_tenants(path, TENANTS, mtime=1)
+        registry = homework.TenantRegistry(str(path))
+        states = {}
+        homework.refresh_tenants(registry, states)
+        write_tenants(path, TENANTS[:1], mtime=1)
+
+        previous = signal.getsignal(signal.SIGHUP)
+        registry.install_signal_handler()
+        timer = threading.Timer(
+            0.1, os.kill, (os.getpid(), signal.SIGHUP)
+        )
+        monkeypatch.setattr(homework, 'RETRY_TIME', 0.2)
+        try:
+            timer.start()
+            start = time.monotonic()
+            assert registry.wait(30, interval=0.05), (
+                'Сигнал должен прерывать ожидание цикла опроса'
+            )
+            assert time.monotonic() - start < 1
+            homework.wait_for_poll(registry, states)
+        finally:
+            timer.cancel()
+            signal.signal(signal.SIGHUP, previous)
+        assert list(states) == ['alice'], (
+            'Перезагрузка по сигналу применяется во время паузы'
+        )
+
+    def test_bulk_validation(self, tmp_path):
+        import tenants
+
+        path = tmp_path / 'tenants.json'
+        write_tenants(path, [
+            TENANTS[0],
+            {'id': 'bob', 'chat_id': 2},
+            'carol',
+            TENANTS[0],
+        ])
+        registry = tenants.TenantRegistry(str(path))
+        with pytest.raises(tenants.TenantConfigError) as error:
+            registry.reload()
+        message = str(error.value)
+        for part in ('#1', 'practicum_token', '#2', 'alice'):
+            assert part in message, (
+                'Все ошибки файла получателей должны выводиться сразу'
+            )
+        assert registry.tenants == {}
+
+    def test_static_registry(self):
+        import tenants
+
+        tenant = tenants.Tenant('default', 'token', 1)
+        registry = tenants.TenantRegistry(tenants=[tenant])
+        assert registry.reload().added == [tenant]
+        assert registry.reload() == ([], [], [])
+
+    def test_refresh_tenants_keeps_cursor(self, tmp_path):
+        import homework
+
+        path = tmp_path / 'tenants.json'
+        write_tenants(path, TENANTS, mtime=1)
+        registry = homework.TenantRegistry(str(path))
+        states = {}
+        assert homework.refresh_tenants(registry, states)
+        states['alice'].timestamp = 42
+
+        write_tenants(path, TENANTS[:1], mtime=2)
+        assert homework.refresh_tenants(registry, states)
+        assert list(states) == ['alice'] and states['alice'].timestamp == 42
+
+        path.write_text('{', encoding='utf-8')
+        assert not homework.refresh_tenants(registry, states)
+        assert list(registry.tenants) == ['alice']
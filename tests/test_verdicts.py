@@ -0,0 +1,105 @@
+import pytest
+
+
+@pytest.fixture
+def clear_caches():
+    import homework
+
+    homework.get_catalogs.cache_clear()
+    homework.render_status.cache_clear()
+    yield
+    homework.get_catalogs.cache_clear()
+    homework.render_status.cache_clear()
+
+
+class TestVerdicts:
+
+    def test_compile_template(self):
+        from verdicts import compile_template
+
+        render = compile_template(
+            '{{json}} "{name}": {verdict}', 'статус {status}'
+        )
+        assert render(name='hw', status='approved') == (
+            '{json} "hw": статус approved'
+        )
+
+    def test_catalog_fallback(self):
+        from verdicts import VerdictCatalog
+
+        catalog = VerdictCatalog('{name}: {verdict}', {'approved': 'ок'})
+        assert catalog.render('hw', 'approved') == 'hw: ок'
+        assert catalog.render('hw', 'unknown') is None
+        catalog = VerdictCatalog(
+            '{name}: {verdict}', {'approved': 'ок'}, fallback='? {status}'
+        )
+        assert catalog.render('hw', 'unknown') == 'hw: ? unknown'
+
+    def test_catalog_from_bad_file(self, tmp_path):
+        from verdicts import VerdictCatalog
+
+        path = tmp_path / 'de.json'
+        path.write_text(
+            '{"template": "{name} {oops}", "verdicts": {"approved": "ok"}}',
+            encoding='utf-8'
+        )
+        with pytest.raises(ValueError):
+            VerdictCatalog.from_file(str(path))
+
+    @pytest.mark.parametrize('verdicts, fallback', [
+        ({'approved': 'ok', 'rejected': 'нет {0}'}, None),
+        ({'approved': 'ok', 'rejected': 'нет {'}, None),
+        ({'approved': 'ok'}, 'статус {unknown_field}'),
+    ])
+    def test_catalog_checks_every_template(self, verdicts, fallback):
+        from verdicts import VerdictCatalog
+
+        with pytest.raises(ValueError):
+            VerdictCatalog('{name}: {verdict}', verdicts, fallback)
+
+    def test_bad_builtin_fallback(self, monkeypatch, clear_caches):
+        import homework
+
+        monkeypatch.setattr(homework, 'HOMEWORK_VERDICT_FALLBACK', '{0}')
+        with pytest.raises(ValueError):
+            homework.get_catalogs()
+
+    def test_tenant_locale(self, clear_caches):
+        import homework
+
+        record = homework.Homework(1, 'hw123', 'approved')
+        assert homework.parse_tenant_status(record, 'en').startswith(
+            'Review status of homework "hw123" has changed.'
+        ), 'Проверьте загрузку каталога из locales/en.json'
+        assert homework.parse_tenant_status(record, 'xx') == (
+            homework.parse_status(record)
+        ), 'Для неизвестной локали используется локаль по умолчанию'
+        assert 'неизвестный' not in homework.parse_tenant_status(
+            homework.Homework(1, 'hw123', 'unknown'), 'en'
+        )
+
+    def test_render_cache(self, clear_caches):
+        import homework
+
+        for _ in range(100):
+            homework.parse_status({'homework_name': 'hw', 'status': 'approved'})
+        info = homework.render_status.cache_info()
+        assert (info.misses, info.hits) == (1, 99), (
+            'Одинаковые сообщения должны форматироваться один раз'
+        )
+
+    def test_configurable_fallback(self, monkeypatch, clear_caches):
+        import homework
+
+        record = homework.Homework(1, 'hw123', 'unknown')
+        with pytest.raises(ValueError):
+            homework.parse_status(record)
+
+        homework.get_catalogs.cache_clear()
+        homework.render_status.cache_clear()
+        monkeypatch.setattr(
+            homework, 'HOMEWORK_VERDICT_FALLBACK', 'Новый статус: {status}.'
+        )
+        assert homework.parse_status(record).endswith(
+            'Новый статус: unknown.'
+        )
@@ -0,0 +1,95 @@
+import json
+import os
+
+from string import Formatter
+
+CATALOG_ERROR = 'Некорректный каталог вердиктов {path}: {error}'
+CATALOG_SUFFIX = '.json'
+TEMPLATE_ERROR = 'Некорректный шаблон сообщения для статуса {status}: {error}'
+FALLBACK_STATUS = '*'
+
+
+def compile_template(template, verdict):
+    """Подстановка вердикта в шаблон заранее, один раз на статус.
+
+    Возвращает связанный str.format шаблона, в котором остались только
+    поля name и status: отрисовка сообщения - одна операция format.
+    Вердикт сам может содержать поля {name} и {status}.
+    """
+    pieces = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        pieces.append(literal.replace('{', '{{').replace('}', '}}'))
+        if field == 'verdict':
+            pieces.append(verdict)
+        elif field is not None:
+            pieces.append(
+                '{' + field
+                + (f'!{conversion}' if conversion else '')
+                + (f':{spec}' if spec else '')
+                + '}'
+            )
+    return ''.join(pieces).format
+
+
+class VerdictCatalog:
+    """Шаблоны сообщений о статусе работы для одной локали."""
+
+    __slots__ = ('templates', 'fallback')
+
+    def __init__(self, template, verdicts, fallback=None):
+        """Без fallback неизвестный статус не отрисовывается.
+
+        Каждый шаблон отрисовывается один раз при создании каталога:
+        ошибка в шаблоне - ValueError здесь, а не при отправке.
+        """
+        self.templates = {
+            status: compile_template(template, verdict)
+            for status, verdict in verdicts.items()
+        }
+        self.fallback = (
+            compile_template(template, fallback) if fallback else None
+        )
+        checks = dict(self.templates)
+        if self.fallback is not None:
+            checks[FALLBACK_STATUS] = self.fallback
+        for status, compiled in checks.items():
+            try:
+                compiled(name='', status=status)
+            except (ValueError, KeyError, IndexError, AttributeError) as error:
+                raise ValueError(
+                    TEMPLATE_ERROR.format(status=status, error=repr(error))
+                )
+
+    def render(self, name, status):
+        """Сообщение о статусе или None для неизвестного статуса."""
+        compiled = self.templates.get(status, self.fallback)
+        if compiled is None:
+            return None
+        return compiled(name=name, status=status)
+
+    @classmethod
+    def from_file(cls, path):
+        """Каталог из JSON с ключами template, verdicts и fallback."""
+        try:
+            with open(path, encoding='utf-8') as file:
+                data = json.load(file)
+            catalog = cls(
+                data['template'], data['verdicts'], data.get('fallback')
+            )
+        except (OSError, ValueError, KeyError, TypeError, IndexError,
+                AttributeError) as error:
+            raise ValueError(CATALOG_ERROR.format(path=path, error=error))
+        return catalog
+
+
+def load_catalogs(directory, builtin):
+    """Встроенные каталоги и файлы <локаль>.json из directory."""
+    catalogs = dict(builtin)
+    if not os.path.isdir(directory):
+        return catalogs
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(CATALOG_SUFFIX):
+            catalogs[filename[:-len(CATALOG_SUFFIX)]] = (
+                VerdictCatalog.from_file(os.path.join(directory, filename))
+            )
+    return catalogs